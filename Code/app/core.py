@@ -1,57 +1,160 @@
 import atexit
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import dearpygui.dearpygui as dpg
 
+from Code.startup_profiler import StartupProfiler
 from Code.tools import (
     APIManager,
     Config,
     FontManager,
+    FrameTaskManager,
+    LogStore,
     TextureManager,
     ThemesManager,
     TimerManager,
     ViewportResizeManager,
 )
 
-from .windows import WindowAuth, WindowLeftPanel
+from .windows import WindowAuth, WindowLeftPanel, WindowSplash
+
+logger = logging.getLogger(__name__)
 
 
 class Core:
+    _startup_time: float = 0.0
+    _phase_timings: list[tuple[str, float, float]] = []
+    _marks: dict[str, float] = {}
+
     @classmethod
-    def _setup(cls) -> None:
-        dpg.create_context()
-        dpg.create_viewport(
-            title="S.P.F. Base client",
-            width=600,
-            height=300,
-        )
+    @contextmanager
+    def _phase(cls, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
 
-        FontManager.load_fonts()
-        ThemesManager.load_themes()
-        TextureManager.load_images()
+        finally:
+            duration = time.perf_counter() - start
+            cls._phase_timings.append((name, start - cls._startup_time, duration))
+            logger.info(f"Startup phase {name} took {duration * 1000:.1f} ms")
 
-        Config.load()
-        atexit.register(Config.save)
+    @classmethod
+    def _since_start(cls) -> float:
+        return (time.perf_counter() - cls._startup_time) * 1000
+
+    @classmethod
+    def _restore_session(cls) -> bool:
+        with cls._phase("session"):
+            if not APIManager.auth.login_refresh():
+                return False
 
-        TimerManager.initialize()
-        atexit.register(TimerManager.stop)
+            APIManager.update_cur_user()
+            return True
 
-        APIManager.setup()
+    @classmethod
+    def _splash_status(cls, text: str) -> None:
+        WindowSplash.set_status(text)
+        dpg.render_dearpygui_frame()
 
-        dpg.set_viewport_resize_callback(ViewportResizeManager.invoke)
+    @classmethod
+    def _on_session_error(cls, error: Exception) -> None:
+        logger.error(f"Failed to restore session: {error}")
+        cls._on_session(False)
 
-        if APIManager.auth.login_refresh():
-            APIManager.update_cur_user()
+    @classmethod
+    def _on_session(cls, authorized: bool) -> None:
+        WindowSplash.delete()
+        if authorized:
             WindowLeftPanel.create()
         else:
             WindowAuth.create()
 
-        dpg.setup_dearpygui()
-        dpg.show_viewport()
+        ViewportResizeManager.invoke()
+        cls._mark("time_to_interactive")
+
+        if StartupProfiler.enabled():
+            StartupProfiler.finish(
+                Config.get_save_dir(),
+                cls._startup_time,
+                cls._phase_timings,
+                cls._marks,
+            )
+
+    @classmethod
+    def _mark(cls, name: str) -> None:
+        cls._marks[name] = cls._since_start()
+        logger.info(f"Startup {name.replace('_', ' ')}: {cls._marks[name]:.1f} ms")
+
+    @classmethod
+    def _setup(cls) -> None:
+        cls._startup_time = time.perf_counter()
+        cls._phase_timings.clear()
+        cls._marks.clear()
+
+        with cls._phase("context"):
+            dpg.create_context()
+            dpg.create_viewport(
+                title="S.P.F. Base client",
+                width=600,
+                height=300,
+            )
+
+        with cls._phase("config"):
+            Config.load()
+            atexit.register(Config.save)
+
+            TimerManager.initialize(Config.get("timer_workers", 2))
+            FrameTaskManager.set_frame_budget(
+                Config.get("frame_task_budget_ms", 4) / 1000
+            )
+            atexit.register(TimerManager.stop)
+            # Registered before APIManager.stop so pending syncs finish first
+            atexit.register(LogStore.close)
+
+            APIManager.setup()
+            atexit.register(APIManager.stop)
+
+        # Network work overlaps with asset loading below
+        APIManager.submit(
+            cls._restore_session,
+            on_done=cls._on_session,
+            on_error=cls._on_session_error,
+        )
+        APIManager.submit(APIManager.download.version)
+
+        # The splash text is Cyrillic, the font must be bound before the first frame
+        with cls._phase("fonts"):
+            FontManager.load_fonts()
+
+        with cls._phase("splash"):
+            dpg.set_viewport_resize_callback(ViewportResizeManager.invoke)
+            WindowSplash.create()
+
+            dpg.setup_dearpygui()
+            dpg.show_viewport()
+            dpg.render_dearpygui_frame()
+
+        cls._mark("time_to_first_frame")
+
+        with cls._phase("assets"):
+            cls._splash_status("Загрузка ресурсов...")
+            ThemesManager.load_themes()
+            TextureManager.load_images()
+
+        # Shown until the session restore started above reports back
+        cls._splash_status("Вход в аккаунт...")
 
     @classmethod
     def run(cls) -> None:
         cls._setup()
-        dpg.start_dearpygui()
+
+        while dpg.is_dearpygui_running():
+            FrameTaskManager.process()
+            dpg.render_dearpygui_frame()
+
         dpg.destroy_context()
 
     @classmethod
@@ -1,2 +1,3 @@
 from .auth import WindowAuth
 from .left_panel import WindowLeftPanel
+from .splash import WindowSplash
@@ -194,19 +194,21 @@ class WindowAuth(BaseWindow):
             cls._summon_popup("Пустое поле ввода", "Пароль не может быть пустым полем.")
             return
 
-        try:
+        def request() -> None:
             APIManager.auth.login(login, password)
-
             APIManager.update_cur_user()
 
-            WindowLeftPanel.create()
-            cls._on_del()
-        except Exception as err:
-            text = {
-                "Incorrect username or password": "Неверный логин или пароль",
-            }.get(str(err), str(err))
-
-            cls._summon_popup("Сервер отослал ошибку", text)
+        cls._set_btns_state(False)
+        cls._run_request(
+            request,
+            on_done=cls._on_authorized,
+            on_error=lambda err: cls._on_auth_error(
+                err,
+                {
+                    "Incorrect username or password": "Неверный логин или пароль",
+                },
+            ),
+        )
 
     @classmethod
     def _register(cls) -> None:
@@ -244,21 +246,39 @@ class WindowAuth(BaseWindow):
             dpg.set_value("login_text", new_login)
             return
 
-        try:
+        def request() -> None:
             APIManager.auth.register(login, password)
-
             APIManager.update_cur_user()
 
-            WindowLeftPanel.create()
-            cls._on_del()
-        except Exception as err:
-            text = {
-                "Username contain non-ascii": "Логин содержит не ascii символы.",
-                "Username cannot be empty": "Логин не может быть пустой строкой.",
-                "User already exists": "Пользоватль с таким логином уже существует.",
-            }.get(str(err), str(err))
+        cls._set_btns_state(False)
+        cls._run_request(
+            request,
+            on_done=cls._on_authorized,
+            on_error=lambda err: cls._on_auth_error(
+                err,
+                {
+                    "Username contain non-ascii": "Логин содержит не ascii символы.",
+                    "Username cannot be empty": "Логин не может быть пустой строкой.",
+                    "User already exists": "Пользоватль с таким логином уже существует.",
+                },
+            ),
+        )
+
+    @classmethod
+    def _set_btns_state(cls, enabled: bool) -> None:
+        for tag in ["login_btn", "switch_btn"]:
+            if dpg.does_item_exist(tag):
+                dpg.configure_item(tag, enabled=enabled)
+
+    @classmethod
+    def _on_authorized(cls, _) -> None:
+        WindowLeftPanel.create()
+        cls._on_del()
 
-            cls._summon_popup("Сервер отослал ошибку", text)
+    @classmethod
+    def _on_auth_error(cls, err: Exception, translate: dict[str, str]) -> None:
+        cls._set_btns_state(True)
+        cls._summon_popup("Сервер отослал ошибку", translate.get(str(err), str(err)))
 
     @classmethod
     def _toggle_see_password(cls) -> None:
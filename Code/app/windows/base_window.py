@@ -1,8 +1,15 @@
 import logging
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any
 
 import dearpygui.dearpygui as dpg
 
-from Code.tools import TimerManager, ViewportResizeManager
+from Code.tools import (
+    APIManager,
+    TimerManager,
+    ViewportResizeManager,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +18,7 @@ class BaseWindow:
     _tag = ""
     _popup_tag = _tag + "_popup"
     _cur_active_windows = []
+    _pending_requests: int = 0
 
     # region Resize
     @classmethod
@@ -81,6 +89,79 @@ class BaseWindow:
 
         return window_width, window_hight
 
+    # region Requests
+    @classmethod
+    def _set_loading(cls, state: bool) -> None:
+        if dpg.does_item_exist(cls._tag + "_loading"):
+            dpg.configure_item(cls._tag + "_loading", show=state)
+
+    @classmethod
+    def _on_request_error(cls, err: Exception) -> None:
+        cls._summon_popup("Сервер отослал ошибку", str(err))
+
+    @classmethod
+    def _run_request(
+        cls,
+        func: Callable[..., Any],
+        *args,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        **kwargs,
+    ) -> Future:
+        on_done, on_error = cls._track_request(on_done, on_error)
+        return APIManager.submit(
+            func, *args, on_done=on_done, on_error=on_error, **kwargs
+        )
+
+    @classmethod
+    def _run_async(
+        cls,
+        coro: Coroutine[Any, Any, Any],
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> Future:
+        from Code.tools import AsyncAPIManager
+
+        AsyncAPIManager.setup()
+        on_done, on_error = cls._track_request(on_done, on_error)
+        return AsyncAPIManager.submit(coro, on_done=on_done, on_error=on_error)
+
+    @classmethod
+    def _track_request(
+        cls,
+        on_done: Callable[[Any], None] | None,
+        on_error: Callable[[Exception], None] | None,
+    ) -> tuple[Callable[[Any], None], Callable[[Exception], None]]:
+        cls._pending_requests += 1
+        cls._set_loading(True)
+
+        def finish() -> None:
+            cls._pending_requests = max(0, cls._pending_requests - 1)
+            if cls._pending_requests == 0:
+                cls._set_loading(False)
+
+        def done(result: Any) -> None:
+            finish()
+            if on_done is not None:
+                on_done(result)
+
+        def error(err: Exception) -> None:
+            finish()
+            (on_error or cls._on_request_error)(err)
+
+        return done, error
+
+    @classmethod
+    def _add_loading_text(cls) -> None:
+        dpg.add_text(
+            "Загрузка...",
+            tag=cls._tag + "_loading",
+            color=[255, 255, 0],
+            show=cls._pending_requests > 0,
+        )
+
+    # endregion
+
     # region Public
     @classmethod
     def create(cls) -> None:
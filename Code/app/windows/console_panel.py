@@ -3,6 +3,7 @@ import dearpygui.dearpygui as dpg
 from Code.tools import APIManager
 
 from .base_window import BaseWindow
+from .ws_metrics_window import WebSocketMetricsWindow
 
 
 class ConsolePanel(BaseWindow):
@@ -28,11 +29,23 @@ class ConsolePanel(BaseWindow):
 
                 kwargs["json"] = json.loads(body_text)
 
-            result = APIManager._requests(method, url, **kwargs)
-            dpg.set_value("debug_response", str(result))
-
         except Exception as e:
             dpg.set_value("debug_response", f"Ошибка: {str(e)}")
+            return
+
+        cls._run_request(
+            APIManager._requests,
+            method,
+            url,
+            on_done=lambda result: cls._set_response(str(result)),
+            on_error=lambda e: cls._set_response(f"Ошибка: {str(e)}"),
+            **kwargs,
+        )
+
+    @classmethod
+    def _set_response(cls, text: str) -> None:
+        if dpg.does_item_exist("debug_response"):
+            dpg.set_value("debug_response", text)
 
     @classmethod
     def create(cls) -> None:
@@ -58,7 +71,14 @@ class ConsolePanel(BaseWindow):
             dpg.add_text("JSON тело запроса (только для POST):")
             dpg.add_input_text(tag="debug_body", multiline=True, height=100, width=600)
 
-            dpg.add_button(label="Отправить запрос", callback=cls._send_debug_request)
+            with dpg.group(horizontal=True):
+                dpg.add_button(
+                    label="Отправить запрос", callback=cls._send_debug_request
+                )
+                dpg.add_button(
+                    label="Метрики WebSocket", callback=WebSocketMetricsWindow.create
+                )
+                cls._add_loading_text()
 
             dpg.add_text("Ответ:", tag="debug_response_label")
             dpg.add_input_text(
@@ -1,6 +1,6 @@
+import importlib
 import itertools
 import webbrowser
-from collections.abc import Callable
 from dataclasses import dataclass
 
 import dearpygui.dearpygui as dpg
@@ -8,27 +8,22 @@ import dearpygui.dearpygui as dpg
 from Code.tools import (
     APIManager,
     Config,
+    LogStore,
     UserAccess,
     ViewportResizeManager,
     WebSocketClient,
 )
 
 from .base_window import BaseWindow
-from .console_panel import ConsolePanel
-from .logs_panel import LogPanel
-from .lore_char_control_panel import LoreCharControlPanel
-from .payment_control_panel import PaymentControlPanel
-from .player_control_panel import PlayerControlPanel
-from .server_control_panel import ServerControlPanel
-from .service_control_panel import ServiceControlPanel
-from .user_access_panel import UserAccessPanel
 
 
 @dataclass
 class _BtnInfo:
     name: str
     tag_postfix: str
-    func: Callable[[], None] | None = None
+    # Panel module and class, imported the first time the button is clicked
+    module: str | None = None
+    class_name: str | None = None
     access: int = 0
 
 
@@ -38,49 +33,57 @@ class WindowLeftPanel(BaseWindow):
         _BtnInfo(
             "Управление правами",
             "_btn_user_access",
-            UserAccessPanel.create,
+            "user_access_panel",
+            "UserAccessPanel",
             UserAccess.READ_USER.value | UserAccess.CONTROL_USER.value,
         ),
         _BtnInfo(
             "Управление сервером",
             "_btn_server_access",
-            ServerControlPanel.create,
+            "server_control_panel",
+            "ServerControlPanel",
             UserAccess.READ_GAME_SERVER.value | UserAccess.CONTROL_GAME_SERVER.value,
         ),
         _BtnInfo(
             "Управление игроками",
             "_btn_player_control",
-            PlayerControlPanel.create,
+            "player_control_panel",
+            "PlayerControlPanel",
             UserAccess.READ_PLAYER.value | UserAccess.CONTROL_PLAYER.value,
         ),
         _BtnInfo(
             "Управление лорными персонажами",
             "_btn_char_control",
-            LoreCharControlPanel.create,
+            "lore_char_control_panel",
+            "LoreCharControlPanel",
             UserAccess.LORE_CHAR_CONTROL.value,
         ),
         _BtnInfo(
             "Управление оплатой",
             "_btn_payment_give",
-            PaymentControlPanel.create,
+            "payment_control_panel",
+            "PaymentControlPanel",
             UserAccess.READ_PAYMENT.value | UserAccess.GIVE_PAYMENT.value,
         ),
         _BtnInfo(
             "Управление сервисами",
             "_btn_payment_access",
-            ServiceControlPanel.create,
+            "service_control_panel",
+            "ServiceControlPanel",
             UserAccess.READ_PAYMENT.value | UserAccess.CONTROL_PAYMENT.value,
         ),
         _BtnInfo(
             "Логи",
             "_btn_logs",
-            LogPanel.create,
+            "logs_panel",
+            "LogPanel",
             UserAccess.READ_LOGS.value,
         ),
         _BtnInfo(
             "Консоль",
             "_btn_consol",
-            ConsolePanel.create,
+            "console_panel",
+            "ConsolePanel",
             UserAccess.ALL_ACCESS.value,
         ),
     ]
@@ -121,12 +124,24 @@ class WindowLeftPanel(BaseWindow):
         if dpg.does_item_exist(cls._tag + "_btn_logout"):
             dpg.set_item_pos(cls._tag + "_btn_logout", [8, window_height - 28])
 
+    @classmethod
+    def _open_panel(cls, sender, app_data, item: _BtnInfo) -> None:
+        if item.module is None or item.class_name is None:
+            return
+
+        if not APIManager.has_access(item.access):
+            return
+
+        module = importlib.import_module(f"{__package__}.{item.module}")
+        getattr(module, item.class_name).create()
+
     @classmethod
     def _logout(cls) -> None:
         cls._on_del()
 
         APIManager.auth.logout()
         WebSocketClient.disconnect()
+        LogStore.clear()
         BaseWindow.close_all_windows()
 
         from .auth import WindowAuth
@@ -141,11 +156,23 @@ class WindowLeftPanel(BaseWindow):
         return tuple(int(part) for part in v.split("."))
 
     @classmethod
-    def create(cls) -> None:
-        up_to_date_version = APIManager.download.version()
-        if up_to_date_version is None:
-            up_to_date_version = Config.app_version
+    def _on_version(cls, up_to_date_version: str | None) -> None:
+        tag = cls._tag + "_btn_update"
+        if up_to_date_version is None or not dpg.does_item_exist(tag):
+            return
 
+        if cls.parse_version(Config.app_version) >= cls.parse_version(
+            up_to_date_version
+        ):
+            return
+
+        dpg.show_item(tag)
+        with dpg.tooltip(tag):
+            dpg.add_text(f"Текущая версия приложения: {Config.app_version}")
+            dpg.add_text(f"Доступная на сервере версия: {up_to_date_version}")
+
+    @classmethod
+    def create(cls) -> None:
         with dpg.window(
             tag=cls._tag,
             no_title_bar=True,
@@ -158,9 +185,10 @@ class WindowLeftPanel(BaseWindow):
                 dpg.add_button(
                     label=item.name,
                     tag=cls._tag + item.tag_postfix,
-                    callback=item.func,  # type: ignore
+                    callback=cls._open_panel,
+                    user_data=item,
                     show=APIManager.has_access(item.access),
-                    enabled=item.func is not None,
+                    enabled=item.module is not None,
                 )
 
             with dpg.group(horizontal=True, tag=cls._tag + "_btn_logout"):
@@ -169,20 +197,15 @@ class WindowLeftPanel(BaseWindow):
                     callback=cls._logout,
                 )
 
-                update_btn_id = dpg.add_button(
+                dpg.add_button(
                     label="!",
-                    show=cls.parse_version(Config.app_version)
-                    < cls.parse_version(up_to_date_version),
+                    tag=cls._tag + "_btn_update",
+                    show=False,
                     callback=lambda: webbrowser.open_new_tab(
                         "https://spf-base.ru/download"
                     ),
                 )
-                if dpg.is_item_shown(update_btn_id):
-                    with dpg.tooltip(update_btn_id):
-                        dpg.add_text(f"Текущая версия приложения: {Config.app_version}")
-                        dpg.add_text(
-                            f"Доступная на сервере версия: {up_to_date_version}"
-                        )
-
-        dpg.bind_item_theme(update_btn_id, "theme_attention")
+
+        dpg.bind_item_theme(cls._tag + "_btn_update", "theme_attention")
+        cls._run_request(APIManager.download.version, on_done=cls._on_version)
         super().create()
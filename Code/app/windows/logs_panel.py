@@ -1,8 +1,19 @@
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock
+from typing import Any
 
 import dearpygui.dearpygui as dpg
 
-from Code.tools import APIManager, LogType, LogTypeTranslate
+from Code.tools import (
+    APIManager,
+    FrameTaskManager,
+    LogStore,
+    LogType,
+    LogTypeTranslate,
+    WebSocketClient,
+)
 
 from .base_window import BaseWindow
 
@@ -11,20 +22,51 @@ class LogPanel(BaseWindow):
     _tag = "LogPanel"
     _server_status = ""
 
+    _columns: list[tuple[str, str]] = [
+        ("id", "ID"),
+        ("type", "Тип"),
+        ("time", "Время"),
+        ("value", "Описание"),
+        ("creator", "Вызвавший"),
+    ]
+
     _start_id: int | None = None
     _end_id: int | None = None
     _page_size: int = 8
-    _max_id = None
-    _min_id = None
+    _offset: int = 0
+    _total_logs: int = 0
+
+    # Pixel sizes used to fit the row pool into the window
+    _row_height: int = 21
+    _reserved_height: int = 120
+    _wheel_step: int = 3
 
     _current_page: int = 1
     _total_pages: int = 1
 
+    _page_cache: OrderedDict[tuple[int, int], list[list[tuple[str, str]]]] = (
+        OrderedDict()
+    )
+    _page_cache_size: int = 16
+    _offset_keys: dict[int, tuple[int, int]] = {}
+    _cache_generation: int = 0
+    # Own worker so prefetches never queue behind requests on the HTTP pool
+    _prefetch_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="LogPrefetch"
+    )
+    _rows: list[list[tuple[str, str]]] = []
+
+    # Live events queued for the next frame, applied in one batch
+    _tail_pending: deque[dict[str, Any]] = deque()
+    # Events that arrive while a gap sync runs wait for it, None when idle
+    _gap_logs: list[dict[str, Any]] | None = None
+    _gap_lock: Lock = Lock()
+
     @classmethod
     def _shorten_string(cls, val: str, max_len: int = 50) -> str:
         if len(val) <= max_len:
             return val
-     
+
         return val[: max_len - 3].rstrip() + "..."
 
     @classmethod
@@ -32,76 +74,247 @@ class LogPanel(BaseWindow):
         if not dpg.does_item_exist(cls._tag):
             return
 
-        window_width, _ = cls._setup_window(app_data, [0.67, 1], [0.33, 0])
+        window_width, window_height = cls._setup_window(
+            app_data, [0.67, 1], [0.33, 0]
+        )
 
         if dpg.does_item_exist("log_page_btns_spaser"):
             dpg.set_item_width("log_page_btns_spaser", window_width - 50 - 32)
 
+        page_size = max(1, (window_height - cls._reserved_height) // cls._row_height)
+        if page_size != cls._page_size:
+            cls._build_row_pool(page_size)
+            cls._reset_page_cache()
+            cls._load_logs_at(cls._offset)
+
+    # region Row pool
     @classmethod
-    def _load_logs_by_range(cls, start_id: int | None, end_id: int | None) -> None:
-        if start_id is None or end_id is None:
-            return
+    def _cell_tag(cls, row: int, col: int) -> str:
+        return f"log_cell_{row}_{col}"
 
-        logs = APIManager.logs.by_range(start_id, end_id)
-        dpg.delete_item("log_table", children_only=True)
+    @classmethod
+    def _build_row_pool(cls, size: int) -> None:
+        cls._page_size = size
+        if not dpg.does_item_exist("log_table"):
+            return
 
-        for label in ["ID", "Тип", "Время", "Описание", "Вызвавший"]:
-            dpg.add_table_column(label=label, parent="log_table")
+        dpg.delete_item("log_table", children_only=True, slot=1)
 
-        for log in logs:
-            with dpg.table_row(parent="log_table"):
-                for key in ["id", "type", "time", "value", "creator"]:
+        for row in range(size):
+            with dpg.table_row(parent="log_table", tag=f"log_row_{row}", show=False):
+                for col in range(len(cls._columns)):
                     with dpg.table_cell():
-                        val = log[key]
-
-                        if key == "time" and isinstance(val, str):
-                            dt = datetime.fromisoformat(val)
-                            val = dt.strftime("%H:%M:%S %d.%m.%Y")
-                        elif key == "type":
-                            try:
-                                type_name = LogType(val).name
-                                val = LogTypeTranslate[type_name].value
-                            except Exception:
-                                val = str(val)
-                        if key == "value":
-                            dpg.add_text(cls._shorten_string(str(val)))
-                        else:
-                            dpg.add_text(str(val))
-
-                        with dpg.tooltip(dpg.last_item()):
-                            dpg.add_text(str(val), wrap=400)
-
-    @classmethod
-    def _update_pagination(cls) -> None:
-        cls._min_id, cls._max_id = APIManager.logs.min_max_id().values()
-        if cls._min_id is None or cls._max_id is None:
-            cls._total_pages = 1
-            cls._current_page = 1
+                        dpg.add_text("", tag=cls._cell_tag(row, col))
+                        with dpg.tooltip(cls._cell_tag(row, col)):
+                            dpg.add_text(
+                                "",
+                                tag=cls._cell_tag(row, col) + "_tip",
+                                wrap=400,
+                            )
+
+    @classmethod
+    def _format_log(cls, log: dict[str, Any]) -> list[tuple[str, str]]:
+        cells = []
+        for key, _ in cls._columns:
+            val = log.get(key)
+
+            if key == "time" and isinstance(val, str):
+                dt = datetime.fromisoformat(val)
+                val = dt.strftime("%H:%M:%S %d.%m.%Y")
+            elif key == "type":
+                try:
+                    type_name = LogType(val).name
+                    val = LogTypeTranslate[type_name].value
+                except Exception:
+                    val = str(val)
+
+            full = str(val)
+            short = cls._shorten_string(full) if key == "value" else full
+            cells.append((short, full))
+
+        return cells
+
+    @classmethod
+    def _render_rows(cls, rows: list[list[tuple[str, str]]]) -> None:
+        cls._rows = rows
+        for row in range(cls._page_size):
+            if not dpg.does_item_exist(f"log_row_{row}"):
+                return
+
+            if row >= len(rows):
+                dpg.configure_item(f"log_row_{row}", show=False)
+                continue
+
+            for col, (short, full) in enumerate(rows[row]):
+                dpg.set_value(cls._cell_tag(row, col), short)
+                dpg.set_value(cls._cell_tag(row, col) + "_tip", full)
+
+            dpg.configure_item(f"log_row_{row}", show=True)
+
+    # endregion
+
+    # region Page cache
+    @classmethod
+    def _query_page(
+        cls,
+        offset: int,
+        limit: int,
+        log_type: LogType | None,
+        creator: str | None,
+    ) -> tuple[tuple[int, int] | None, list[list[tuple[str, str]]]]:
+        logs = LogStore.page(offset, limit, log_type, creator)
+        if not logs:
+            return None, []
+
+        return (logs[0]["id"], logs[-1]["id"]), [cls._format_log(log) for log in logs]
+
+    @classmethod
+    def _cache_page(
+        cls,
+        offset: int,
+        key: tuple[int, int] | None,
+        rows: list[list[tuple[str, str]]],
+    ) -> None:
+        if key is None:
             return
 
-        total_logs = cls._max_id - cls._min_id + 1
-        cls._total_pages = max(1, (total_logs + cls._page_size - 1) // cls._page_size)
+        cls._offset_keys[offset] = key
+        cls._page_cache[key] = rows
+        cls._page_cache.move_to_end(key)
+
+        while len(cls._page_cache) > cls._page_cache_size:
+            old_key, _ = cls._page_cache.popitem(last=False)
+            cls._offset_keys = {
+                k: v for k, v in cls._offset_keys.items() if v != old_key
+            }
+
+    @classmethod
+    def _drop_tail_pages(cls, old_total: int) -> None:
+        # Pages that reached past the old end now hold different rows
+        cls._cache_generation += 1
+        for offset in [o for o in cls._offset_keys if o + cls._page_size > old_total]:
+            cls._page_cache.pop(cls._offset_keys.pop(offset), None)
+
+    @classmethod
+    def _reset_page_cache(cls) -> None:
+        cls._cache_generation += 1
+        cls._page_cache.clear()
+        cls._offset_keys.clear()
+        cls._total_logs = LogStore.count(cls._filter_type(), cls._filter_creator())
 
-        if cls._current_page > cls._total_pages:
-            cls._current_page = cls._total_pages
-        if cls._current_page < 1:
-            cls._current_page = 1
+    @classmethod
+    def _clamp_offset(cls, offset: int) -> int:
+        return min(max(offset, 0), max(0, cls._total_logs - cls._page_size))
+
+    @classmethod
+    def _prefetch(cls) -> None:
+        log_type = cls._filter_type()
+        creator = cls._filter_creator()
+        generation = cls._cache_generation
+
+        for offset in (cls._offset + cls._page_size, cls._offset - cls._page_size):
+            offset = cls._clamp_offset(offset)
+            if offset == cls._offset or offset in cls._offset_keys:
+                continue
+
+            future = cls._prefetch_executor.submit(
+                cls._prefetch_page,
+                generation,
+                offset,
+                cls._page_size,
+                log_type,
+                creator,
+            )
+            APIManager.watch(
+                future,
+                on_done=lambda res, offset=offset: cls._on_prefetched(
+                    generation, offset, res
+                ),
+                name="LogPanel._prefetch_page",
+            )
 
     @classmethod
-    def _load_logs_for_page(cls, page: int) -> None:
-        cls._update_pagination()
-        cls._current_page = page
+    def _prefetch_page(
+        cls,
+        generation: int,
+        offset: int,
+        limit: int,
+        log_type: LogType | None,
+        creator: str | None,
+    ) -> tuple[tuple[int, int] | None, list[list[tuple[str, str]]]]:
+        # Jobs queued before a filter change or page resize are skipped unrun
+        if generation != cls._cache_generation:
+            return None, []
+
+        return cls._query_page(offset, limit, log_type, creator)
 
-        if cls._min_id is None or cls._max_id is None:
+    @classmethod
+    def _on_prefetched(
+        cls,
+        generation: int,
+        offset: int,
+        result: tuple[tuple[int, int] | None, list[list[tuple[str, str]]]],
+    ) -> None:
+        if generation != cls._cache_generation:
             return
 
-        start_id = cls._min_id + (cls._current_page - 1) * cls._page_size
-        end_id = min(start_id + cls._page_size - 1, cls._max_id)
+        key, rows = result
+        cls._cache_page(offset, key, rows)
+
+    # endregion
+
+    @classmethod
+    def _filter_type(cls) -> LogType | None:
+        if not dpg.does_item_exist("log_filter_type"):
+            return None
 
-        cls._start_id = start_id
-        cls._end_id = end_id
+        label = dpg.get_value("log_filter_type")
+        for item in LogTypeTranslate:
+            if item.value == label:
+                return LogType[item.name]
 
-        cls._load_logs_by_range(start_id, end_id)
+        return None
+
+    @classmethod
+    def _filter_creator(cls) -> str | None:
+        if not dpg.does_item_exist("log_filter_creator"):
+            return None
+
+        return dpg.get_value("log_filter_creator").strip() or None
+
+    @classmethod
+    def _load_logs_at(cls, offset: int) -> None:
+        cls._offset = cls._clamp_offset(offset)
+
+        key = cls._offset_keys.get(cls._offset)
+        rows = cls._page_cache.get(key) if key is not None else None
+
+        if key is None or rows is None:
+            key, rows = cls._query_page(
+                cls._offset,
+                cls._page_size,
+                cls._filter_type(),
+                cls._filter_creator(),
+            )
+            cls._cache_page(cls._offset, key, rows)
+
+        else:
+            cls._page_cache.move_to_end(key)
+
+        cls._start_id, cls._end_id = key if key is not None else (None, None)
+
+        cls._render_rows(rows)
+        cls._update_page_info()
+        cls._prefetch()
+
+    @classmethod
+    def _update_page_info(cls) -> None:
+        cls._total_pages = max(
+            1, (cls._total_logs + cls._page_size - 1) // cls._page_size
+        )
+        cls._current_page = min(
+            cls._total_pages, (cls._offset + cls._page_size - 1) // cls._page_size + 1
+        )
 
         if dpg.does_item_exist("log_page_info"):
             dpg.set_value(
@@ -111,16 +324,124 @@ class LogPanel(BaseWindow):
 
     @classmethod
     def _change_page(cls, sender, app_data, user_data) -> None:
-        cls._update_pagination()
-        if user_data == "next" and cls._current_page < cls._total_pages:
-            cls._load_logs_for_page(cls._current_page + 1)
-        elif user_data == "prev" and cls._current_page > 1:
-            cls._load_logs_for_page(cls._current_page - 1)
+        if user_data == "next":
+            cls._load_logs_at(cls._offset + cls._page_size)
+        elif user_data == "prev":
+            cls._load_logs_at(cls._offset - cls._page_size)
+
+    @classmethod
+    def _on_wheel(cls, sender, app_data) -> None:
+        if not dpg.does_item_exist("log_table") or not dpg.is_item_hovered(
+            "log_table"
+        ):
+            return
+
+        cls._load_logs_at(cls._offset - int(app_data) * cls._wheel_step)
+
+    # region Live tail
+    @classmethod
+    def _on_log_event(cls, **log) -> None:
+        with cls._gap_lock:
+            if cls._gap_logs is not None:
+                cls._gap_logs.append(log)
+                return
+
+            local_max = LogStore.max_id()
+            if local_max is None or log["id"] > local_max + 1:
+                cls._gap_logs = [log]
+                APIManager.submit(
+                    LogStore.sync,
+                    on_done=cls._on_gap_synced,
+                    on_error=cls._on_gap_synced,
+                )
+                return
+
+        LogStore.insert([log])
+        cls._queue_tail(log)
+
+    @classmethod
+    def _on_gap_synced(cls, _) -> None:
+        with cls._gap_lock:
+            logs, cls._gap_logs = cls._gap_logs or [], None
+
+        # Events newer than the sync snapshot are stored directly, the
+        # sync watermark still lets the next sync fill anything missed
+        LogStore.insert(logs)
+        for log in logs:
+            cls._queue_tail(log)
+
+    @classmethod
+    def _queue_tail(cls, log: dict[str, Any]) -> None:
+        # Queued only once stored, so the batch never outruns LogStore.count
+        cls._tail_pending.append(log)
+        FrameTaskManager.post(cls._flush_tail, cls._tag + "_tail")
+
+    @classmethod
+    def _matches_filter(cls, log: dict[str, Any]) -> bool:
+        log_type = cls._filter_type()
+        if log_type is not None and log.get("type") != log_type.value:
+            return False
+
+        creator = cls._filter_creator()
+        if creator and log.get("creator") != creator:
+            return False
+
+        return True
+
+    @classmethod
+    def _flush_tail(cls) -> None:
+        added = []
+        while cls._tail_pending:
+            log = cls._tail_pending.popleft()
+            if cls._matches_filter(log):
+                added.append(log)
+
+        if not dpg.does_item_exist(cls._tag) or not added:
+            return
+
+        old_total = cls._total_logs
+        at_tail = cls._offset + cls._page_size >= old_total
+
+        cls._total_logs = LogStore.count(cls._filter_type(), cls._filter_creator())
+        cls._drop_tail_pages(old_total)
+
+        if not at_tail:
+            cls._load_logs_at(cls._offset)
+            return
+
+        # A gap sync pulled in more rows than the events carried, reload the tail
+        if cls._total_logs - old_total != len(added):
+            cls._load_logs_at(cls._total_logs)
+            return
+
+        rows = cls._rows + [cls._format_log(log) for log in added]
+        rows = rows[-cls._page_size :]
+
+        cls._offset = cls._clamp_offset(cls._total_logs)
+        cls._start_id, cls._end_id = int(rows[0][0][1]), added[-1]["id"]
+        cls._cache_page(cls._offset, (cls._start_id, cls._end_id), rows)
+
+        cls._render_rows(rows)
+        cls._update_page_info()
+        cls._prefetch()
+
+    # endregion
+
+    @classmethod
+    def _on_filter(cls) -> None:
+        cls._reset_page_cache()
+        cls._load_logs_at(0)
 
     @classmethod
     def _ref_log_id(cls) -> None:
-        cls._update_pagination()
-        cls._load_logs_for_page(cls._current_page)
+        cls._run_request(LogStore.sync, on_done=cls._on_synced)
+
+    @classmethod
+    def _on_synced(cls, fetched: int) -> None:
+        if fetched:
+            cls._reset_page_cache()
+
+        cls._load_logs_at(cls._offset)
 
     @classmethod
     def create(cls) -> None:
@@ -143,6 +464,23 @@ class LogPanel(BaseWindow):
                     tag="log_page_info",
                 )
                 dpg.add_button(label="Обновить логи", callback=cls._ref_log_id)
+                cls._add_loading_text()
+
+            with dpg.group(horizontal=True):
+                dpg.add_combo(
+                    ["Все типы"] + [item.value for item in LogTypeTranslate],
+                    default_value="Все типы",
+                    tag="log_filter_type",
+                    width=200,
+                    callback=cls._on_filter,
+                )
+                dpg.add_input_text(
+                    hint="Вызвавший",
+                    tag="log_filter_creator",
+                    width=160,
+                    on_enter=True,
+                    callback=cls._on_filter,
+                )
 
             with dpg.table(
                 policy=dpg.mvTable_SizingStretchProp,
@@ -152,7 +490,8 @@ class LogPanel(BaseWindow):
                 borders_outerV=True,
                 tag="log_table",
             ):
-                pass
+                for _, label in cls._columns:
+                    dpg.add_table_column(label=label)
 
             dpg.add_separator()
             with dpg.group(horizontal=True):
@@ -160,5 +499,23 @@ class LogPanel(BaseWindow):
                 dpg.add_spacer(tag="log_page_btns_spaser")
                 dpg.add_button(label="→", callback=cls._change_page, user_data="next")
 
-        cls._load_logs_for_page(1)
+        with dpg.handler_registry(tag=cls._tag + "_handlers"):
+            dpg.add_mouse_wheel_handler(callback=cls._on_wheel)
+
+        WebSocketClient.subscribe("logs_new", cls._on_log_event)
+        APIManager.submit(APIManager.logs.subscribe)
+
+        cls._build_row_pool(cls._page_size)
         super().create()
+        cls._reset_page_cache()
+        cls._load_logs_at(0)
+        cls._ref_log_id()
+
+    @classmethod
+    def _on_del(cls) -> None:
+        super()._on_del()
+        if dpg.does_item_exist(cls._tag + "_handlers"):
+            dpg.delete_item(cls._tag + "_handlers")
+
+        APIManager.submit(APIManager.logs.unsubscribe)
+        WebSocketClient.unsubscribe("logs_new", cls._on_log_event)
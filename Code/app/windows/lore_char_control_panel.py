@@ -70,8 +70,6 @@ class LoreCharControlPanel(BaseWindow):
             dpg.focus_item(cls._tag)
             return
 
-        cls._lore_data = APIManager.lore_char_control.get()
-
         with dpg.window(
             tag=cls._tag,
             no_title_bar=True,
@@ -81,16 +79,37 @@ class LoreCharControlPanel(BaseWindow):
             pos=[0, 0],
             no_scrollbar=True,
         ):
-            dpg.add_button(
-                label="Создать лорного персонажа",
-                callback=cls._create_modal_window,
-            )
+            with dpg.group(horizontal=True):
+                dpg.add_button(
+                    label="Создать лорного персонажа",
+                    callback=cls._create_modal_window,
+                )
+                dpg.add_spacer(width=8)
+                cls._add_loading_text()
+
             dpg.add_separator()
             dpg.add_text("Все доступные лорные персонажи:")
             dpg.add_group(tag="lore_char_group")
             cls._render_btns()
 
         super().create()
+        cls._refresh()
+
+    @classmethod
+    def _refresh(cls) -> None:
+        cls._run_request(APIManager.lore_char_control.get, on_done=cls._on_refresh)
+
+    @classmethod
+    def _on_refresh(cls, lore_data: dict) -> None:
+        cls._lore_data = lore_data
+        cls._render_btns()
+        ViewportResizeManager.invoke()
+
+    @classmethod
+    def _on_saved(cls, modal_tag: str) -> None:
+        cls._refresh()
+        if dpg.does_item_exist(modal_tag):
+            dpg.delete_item(modal_tag)
 
     @classmethod
     def _on_modal_delete(cls) -> None:
@@ -172,11 +191,14 @@ class LoreCharControlPanel(BaseWindow):
             case "Заблокирован":
                 status = "blocked"
 
-        APIManager.lore_char_control.create(key, name, status, wiki)
-        cls._lore_data = APIManager.lore_char_control.get()
-        cls._render_btns()
-        dpg.delete_item(cls._tag + "_modal_create")
-        ViewportResizeManager.invoke()
+        cls._run_request(
+            APIManager.lore_char_control.create,
+            key,
+            name,
+            status,
+            wiki,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_create"),
+        )
 
     @classmethod
     def _edit(cls, key: str) -> None:
@@ -194,19 +216,22 @@ class LoreCharControlPanel(BaseWindow):
             case "Заблокирован":
                 status = "blocked"
 
-        APIManager.lore_char_control.edit(key, name, status, wiki)
-        cls._lore_data = APIManager.lore_char_control.get()
-        cls._render_btns()
-        dpg.delete_item(cls._tag + "_modal_edit")
-        ViewportResizeManager.invoke()
+        cls._run_request(
+            APIManager.lore_char_control.edit,
+            key,
+            name,
+            status,
+            wiki,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_edit"),
+        )
 
     @classmethod
     def _delete(cls, key: str) -> None:
-        APIManager.lore_char_control.delete(key)
-        cls._lore_data = APIManager.lore_char_control.get()
-        cls._render_btns()
-        dpg.delete_item(cls._tag + "_modal_edit")
-        ViewportResizeManager.invoke()
+        cls._run_request(
+            APIManager.lore_char_control.delete,
+            key,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_edit"),
+        )
 
     @classmethod
     def _create_modal_window(cls) -> None:
@@ -53,18 +53,32 @@ class PaymentControlPanel(BaseWindow):
                     dpg.set_item_width(child, each)
 
     @classmethod
-    def _refresh(cls) -> None:
-        try:
-            cls._rows = APIManager.payment_control.list()
+    def _set_status_line(cls, text: str) -> None:
+        if dpg.does_item_exist("pay_status_line"):
+            dpg.set_value("pay_status_line", text)
 
-        except Exception as e:
-            cls._rows = []
-            if dpg.does_item_exist("pay_status_line"):
-                dpg.set_value("pay_status_line", f"Ошибка: {e}")
+    @classmethod
+    def _refresh(cls, force: bool = False) -> None:
+        if force:
+            APIManager.invalidate("payment_control")
+
+        cls._run_request(
+            APIManager.payment_control.list,
+            on_done=cls._on_refresh,
+            on_error=cls._on_refresh_error,
+        )
 
+    @classmethod
+    def _on_refresh(cls, rows: list[dict]) -> None:
+        cls._rows = rows
         cls._render_table()
         ViewportResizeManager.invoke()
 
+    @classmethod
+    def _on_refresh_error(cls, err: Exception) -> None:
+        cls._set_status_line(f"Ошибка: {err}")
+        cls._on_refresh([])
+
     @classmethod
     def _render_table(cls) -> None:
         if not dpg.does_item_exist("pay_table"):
@@ -104,28 +118,28 @@ class PaymentControlPanel(BaseWindow):
                     )
 
     @classmethod
-    def _cancel(cls, u_id: str) -> None:
-        try:
-            APIManager.payment_control.edit(u_id=u_id, status="cancelled")
-            if dpg.does_item_exist("pay_status_line"):
-                dpg.set_value("pay_status_line", f"Отменено: {u_id}")
-        except Exception as e:
-            if dpg.does_item_exist("pay_status_line"):
-                dpg.set_value("pay_status_line", f"Ошибка отмены: {e}")
+    def _finish_action(cls, text: str) -> None:
+        cls._set_status_line(text)
         cls._refresh()
 
     @classmethod
-    def _delete(cls, u_id: str) -> None:
-        try:
-            APIManager.payment_control.delete(u_id)
-            if dpg.does_item_exist("pay_status_line"):
-                dpg.set_value("pay_status_line", f"Удалено: {u_id}")
-
-        except Exception as e:
-            if dpg.does_item_exist("pay_status_line"):
-                dpg.set_value("pay_status_line", f"Ошибка удаления: {e}")
+    def _cancel(cls, u_id: str) -> None:
+        cls._run_request(
+            APIManager.payment_control.edit,
+            u_id=u_id,
+            status="cancelled",
+            on_done=lambda _: cls._finish_action(f"Отменено: {u_id}"),
+            on_error=lambda e: cls._finish_action(f"Ошибка отмены: {e}"),
+        )
 
-        cls._refresh()
+    @classmethod
+    def _delete(cls, u_id: str) -> None:
+        cls._run_request(
+            APIManager.payment_control.delete,
+            u_id,
+            on_done=lambda _: cls._finish_action(f"Удалено: {u_id}"),
+            on_error=lambda e: cls._finish_action(f"Ошибка удаления: {e}"),
+        )
 
     @classmethod
     def _open_create_modal(cls) -> None:
@@ -196,27 +210,22 @@ class PaymentControlPanel(BaseWindow):
         except Exception as e:
             raise RuntimeError(f"Invalid items JSON: {e}")
 
-        try:
-            res = APIManager.payment_control.create(
-                player_id=player_id,
-                items=items,
-                commission_key=comm_key,
-                status=status,
-            )
-            msg = f"Создан платёж {res.get('u_id')} на сумму {res.get('total')}"
-            if dpg.does_item_exist("pay_status_line"):
-                dpg.set_value("pay_status_line", msg)
-
-        except Exception as e:
-            if dpg.does_item_exist("pay_status_line"):
-                dpg.set_value("pay_status_line", f"Ошибка создания: {e}")
+        cls._run_request(
+            APIManager.payment_control.create,
+            player_id=player_id,
+            items=items,
+            commission_key=comm_key,
+            status=status,
+            on_done=lambda res: cls._finish_action(
+                f"Создан платёж {res.get('u_id')} на сумму {res.get('total')}"
+            ),
+            on_error=lambda e: cls._finish_action(f"Ошибка создания: {e}"),
+        )
 
         if dpg.does_item_exist(cls._tag + "_create"):
             dpg.delete_item(cls._tag + "_create")
         ViewportResizeManager.remove_callback(cls._tag + "_create")
 
-        cls._refresh()
-
     @classmethod
     def create(cls) -> None:
         if dpg.does_item_exist(cls._tag):
@@ -235,8 +244,9 @@ class PaymentControlPanel(BaseWindow):
             with dpg.group(horizontal=True):
                 dpg.add_button(label="Создать платёж", callback=cls._open_create_modal)
                 dpg.add_spacer(width=8)
-                dpg.add_button(label="Обновить", callback=cls._refresh)
+                dpg.add_button(label="Обновить", callback=lambda: cls._refresh(True))
                 dpg.add_spacer(width=16)
+                cls._add_loading_text()
                 dpg.add_text("", tag="pay_status_line")
 
             dpg.add_separator()
@@ -253,5 +263,5 @@ class PaymentControlPanel(BaseWindow):
             ):
                 pass
 
-        cls._refresh()
         super().create()
+        cls._refresh()
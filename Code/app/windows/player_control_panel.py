@@ -61,8 +61,6 @@ class PlayerControlPanel(BaseWindow):
             dpg.focus_item(cls._tag)
             return
 
-        cls._p_data = APIManager.player_control.get()
-
         with dpg.window(
             tag=cls._tag,
             no_title_bar=True,
@@ -77,17 +75,27 @@ class PlayerControlPanel(BaseWindow):
                     label="Создать игрока", callback=cls._create_modal_window
                 )
                 dpg.add_spacer(width=8)
-                dpg.add_button(label="Обновить", callback=cls._refresh)
+                dpg.add_button(label="Обновить", callback=lambda: cls._refresh(True))
+                dpg.add_spacer(width=8)
+                cls._add_loading_text()
 
             dpg.add_separator()
             dpg.add_group(tag="player_group")
 
         cls._render_btns()
         super().create()
+        cls._refresh()
+
+    @classmethod
+    def _refresh(cls, force: bool = False) -> None:
+        if force:
+            APIManager.invalidate("player_control")
+
+        cls._run_request(APIManager.player_control.get, on_done=cls._on_refresh)
 
     @classmethod
-    def _refresh(cls) -> None:
-        cls._p_data = APIManager.player_control.get()
+    def _on_refresh(cls, p_data: list[dict]) -> None:
+        cls._p_data = p_data
         cls._render_btns()
         ViewportResizeManager.invoke()
 
@@ -172,10 +180,18 @@ class PlayerControlPanel(BaseWindow):
         if not steam_url:
             raise RuntimeError("Steam URL is required")
 
-        APIManager.player_control.create(discord_name=discord_name, steam_url=steam_url)
+        cls._run_request(
+            APIManager.player_control.create,
+            discord_name=discord_name,
+            steam_url=steam_url,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_create"),
+        )
+
+    @classmethod
+    def _on_saved(cls, modal_tag: str) -> None:
         cls._refresh()
-        if dpg.does_item_exist(cls._tag + "_modal_create"):
-            dpg.delete_item(cls._tag + "_modal_create")
+        if dpg.does_item_exist(modal_tag):
+            dpg.delete_item(modal_tag)
 
     # ---------- edit modal ----------
 
@@ -410,26 +426,31 @@ class PlayerControlPanel(BaseWindow):
         mb_limit = mb_limit_raw if mb_limit_raw else None
         mb_taken = mb_taken_raw if mb_taken_raw else None
 
-        APIManager.player_control.edit(
+        cls._run_request(
+            APIManager.player_control.edit,
             u_id=u_id,
             discord_name=discord_name or None,
             blacklist=blacklist or None,
             mb_limit=mb_limit or None,
             mb_taken=mb_taken or None,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_edit"),
         )
 
-        cls._refresh()
-        if dpg.does_item_exist(cls._tag + "_modal_edit"):
-            dpg.delete_item(cls._tag + "_modal_edit")
-
     @classmethod
     def _add_note(cls, u_id: int) -> None:
         text = dpg.get_value("add_note_text").strip()
         if not text:
             raise RuntimeError("Note text is required")
 
-        APIManager.player_control.add_note(u_id=u_id, text=text)
-        cls._p_data = APIManager.player_control.get()
+        def request() -> list[dict]:
+            APIManager.player_control.add_note(u_id=u_id, text=text)
+            return APIManager.player_control.get()
+
+        cls._run_request(request, on_done=lambda p: cls._reopen_edit_modal(p, u_id))
+
+    @classmethod
+    def _reopen_edit_modal(cls, p_data: list[dict], u_id: int) -> None:
+        cls._on_refresh(p_data)
         if dpg.does_item_exist(cls._tag + "_modal_edit"):
             dpg.delete_item(cls._tag + "_modal_edit")
 
@@ -445,11 +466,10 @@ class PlayerControlPanel(BaseWindow):
         if not status:
             raise RuntimeError("New status is required")
 
-        APIManager.player_control.change_note_status(
-            u_id=u_id, index=index, status=status
-        )
-        cls._p_data = APIManager.player_control.get()
-        if dpg.does_item_exist(cls._tag + "_modal_edit"):
-            dpg.delete_item(cls._tag + "_modal_edit")
+        def request() -> list[dict]:
+            APIManager.player_control.change_note_status(
+                u_id=u_id, index=index, status=status
+            )
+            return APIManager.player_control.get()
 
-        cls._edit_modal_window(None, None, u_id)
+        cls._run_request(request, on_done=lambda p: cls._reopen_edit_modal(p, u_id))
@@ -1,6 +1,6 @@
 import dearpygui.dearpygui as dpg
 
-from Code.tools import APIManager, WebSocketClient
+from Code.tools import APIManager, FrameTaskManager, WebSocketClient
 
 from .base_window import BaseWindow
 
@@ -52,6 +52,10 @@ class ServerControlPanel(BaseWindow):
         cls._server_status = status
         cls._setup_status()
 
+    @classmethod
+    def _on_status_event(cls, status: str) -> None:
+        FrameTaskManager.post(lambda: cls._update_status(status), cls._tag + "_status")
+
     @classmethod
     def _act(cls, sender, app_data, user_data) -> None:
         if cls._server_status == "Выключен" and user_data == "stop":
@@ -67,12 +71,26 @@ class ServerControlPanel(BaseWindow):
             return
 
         if user_data == "start":
-            APIManager.server_control.start()
+            func = APIManager.server_control.start
 
         elif user_data == "stop":
-            APIManager.server_control.stop()
+            func = APIManager.server_control.stop
+
+        else:
+            return
 
         cls._set_btns_state(False)
+        cls._run_request(func, on_error=cls._on_act_error)
+
+    @classmethod
+    def _on_act_error(cls, err: Exception) -> None:
+        cls._setup_status()
+        cls._on_request_error(err)
+
+    @classmethod
+    def _load_status(cls) -> str:
+        APIManager.server_control.status_subscribe()
+        return APIManager.server_control.status()
 
     @classmethod
     def create(cls) -> None:
@@ -115,16 +133,14 @@ class ServerControlPanel(BaseWindow):
                     user_data="stop",
                 )
 
-        WebSocketClient.subscribe("server_control_status", cls._update_status)
-        APIManager.server_control.status_subscribe()
-
-        cls._server_status = APIManager.server_control.status()
-        cls._setup_status()
+        cls._set_btns_state(False)
+        WebSocketClient.subscribe("server_control_status", cls._on_status_event)
+        cls._run_request(cls._load_status, on_done=cls._update_status)
 
         super().create()
 
     @classmethod
     def _on_del(cls) -> None:
         super()._on_del()
-        APIManager.server_control.status_unsubscribe()
-        WebSocketClient.unsubscribe("server_control_status", cls._update_status)
+        APIManager.submit(APIManager.server_control.status_unsubscribe)
+        WebSocketClient.unsubscribe("server_control_status", cls._on_status_event)
@@ -153,8 +153,6 @@ class ServiceControlPanel(BaseWindow):
             dpg.focus_item(cls._tag)
             return
 
-        cls._s_data = APIManager.service_control.list()
-
         with dpg.window(
             tag=cls._tag,
             no_title_bar=True,
@@ -167,20 +165,36 @@ class ServiceControlPanel(BaseWindow):
             with dpg.group(horizontal=True):
                 dpg.add_button(label="Создать услугу", callback=cls._open_create_modal)
                 dpg.add_spacer(width=8)
-                dpg.add_button(label="Обновить", callback=cls._refresh)
+                dpg.add_button(label="Обновить", callback=lambda: cls._refresh(True))
+                dpg.add_spacer(width=8)
+                cls._add_loading_text()
 
             dpg.add_separator()
             dpg.add_group(tag="service_group")
 
         cls._render_btns()
         super().create()
+        cls._refresh()
+
+    @classmethod
+    def _refresh(cls, force: bool = False) -> None:
+        if force:
+            APIManager.invalidate("service_control")
+
+        cls._run_request(APIManager.service_control.list, on_done=cls._on_refresh)
 
     @classmethod
-    def _refresh(cls) -> None:
-        cls._s_data = APIManager.service_control.list()
+    def _on_refresh(cls, s_data: list[dict]) -> None:
+        cls._s_data = s_data
         cls._render_btns()
         ViewportResizeManager.invoke()
 
+    @classmethod
+    def _on_saved(cls, modal_tag: str) -> None:
+        cls._refresh()
+        if dpg.does_item_exist(modal_tag):
+            dpg.delete_item(modal_tag)
+
     @classmethod
     def _on_modal_delete(cls) -> None:
         if dpg.does_item_exist(cls._tag + "_modal_create"):
@@ -418,7 +432,8 @@ class ServiceControlPanel(BaseWindow):
         else:
             left = None
 
-        APIManager.service_control.create(
+        cls._run_request(
+            APIManager.service_control.create,
             name=name,
             description=description or "",
             price_main=price_main,
@@ -428,12 +443,9 @@ class ServiceControlPanel(BaseWindow):
             left=left,
             sell_time=sell_time_iso,
             oferta_limit=oferta_limit,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_create"),
         )
 
-        cls._refresh()
-        if dpg.does_item_exist(cls._tag + "_modal_create"):
-            dpg.delete_item(cls._tag + "_modal_create")
-
     @classmethod
     def _on_modal_edit_resize(cls, app_data: tuple[int, int, int, int]) -> None:
         if not dpg.does_item_exist(cls._tag + "_modal_edit"):
@@ -474,14 +486,25 @@ class ServiceControlPanel(BaseWindow):
         if not sdata:
             return
 
-        full = APIManager.service_control.get(u_id)
-        data = (full.get("data") or sdata.get("data")) or {}
-        final_price = full.get("final_price") or sdata.get("final_price") or "0.00"
+        if dpg.does_item_exist(cls._tag + "_modal_edit"):
+            dpg.focus_item(cls._tag + "_modal_edit")
+            return
+
+        cls._run_request(
+            APIManager.service_control.get,
+            u_id,
+            on_done=lambda full: cls._build_edit_modal(u_id, sdata, full),
+        )
 
+    @classmethod
+    def _build_edit_modal(cls, u_id: str, sdata: dict, full: dict) -> None:
         if dpg.does_item_exist(cls._tag + "_modal_edit"):
             dpg.focus_item(cls._tag + "_modal_edit")
             return
 
+        data = (full.get("data") or sdata.get("data")) or {}
+        final_price = full.get("final_price") or sdata.get("final_price") or "0.00"
+
         creation_iso = data.get("creation_date")
         dd_iso = data.get("discount_date")
         st_iso = data.get("sell_time")
@@ -709,14 +732,16 @@ class ServiceControlPanel(BaseWindow):
     def _save_service(cls, u_id: str) -> None:
         payload = cls._collect_edit_payload()
         payload["u_id"] = u_id
-        APIManager.service_control.edit(**payload)
-        cls._refresh()
-        if dpg.does_item_exist(cls._tag + "_modal_edit"):
-            dpg.delete_item(cls._tag + "_modal_edit")
+        cls._run_request(
+            APIManager.service_control.edit,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_edit"),
+            **payload,
+        )
 
     @classmethod
     def _delete_service(cls, u_id: str) -> None:
-        APIManager.service_control.delete(u_id)
-        cls._refresh()
-        if dpg.does_item_exist(cls._tag + "_modal_edit"):
-            dpg.delete_item(cls._tag + "_modal_edit")
+        cls._run_request(
+            APIManager.service_control.delete,
+            u_id,
+            on_done=lambda _: cls._on_saved(cls._tag + "_modal_edit"),
+        )
@@ -0,0 +1,48 @@
+import dearpygui.dearpygui as dpg
+
+from .base_window import BaseWindow
+
+
+class WindowSplash(BaseWindow):
+    _tag = "WindowSplash"
+
+    @classmethod
+    def _on_resize(cls, app_data: tuple[int, int, int, int]) -> None:
+        if not dpg.does_item_exist(cls._tag):
+            return
+
+        width, height = cls._setup_window(app_data, [1, 1], [0, 0])
+
+        for offset, tag in [(-12, "splash_header"), (12, "splash_status")]:
+            if dpg.does_item_exist(tag):
+                text_size = dpg.get_text_size(dpg.get_value(tag))
+                text_width = text_size[0] if text_size else 0
+                dpg.set_item_pos(
+                    tag, [width // 2 - text_width // 2, height // 2 + offset]
+                )
+
+    @classmethod
+    def set_status(cls, text: str) -> None:
+        if dpg.does_item_exist("splash_status"):
+            dpg.set_value("splash_status", text)
+            cls._invoce_resize()
+
+    @classmethod
+    def create(cls) -> None:
+        if dpg.does_item_exist(cls._tag):
+            dpg.focus_item(cls._tag)
+            return
+
+        with dpg.window(
+            tag=cls._tag,
+            no_title_bar=True,
+            no_move=True,
+            no_resize=True,
+            no_scrollbar=True,
+            on_close=cls._on_del,
+            pos=[0, 0],
+        ):
+            dpg.add_text("S.P.F. Base", tag="splash_header")
+            dpg.add_text("Загрузка...", tag="splash_status", color=[255, 255, 0])
+
+        super().create()
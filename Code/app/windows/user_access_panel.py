@@ -3,7 +3,14 @@ from dataclasses import dataclass
 
 import dearpygui.dearpygui as dpg
 
-from Code.tools import APIError, APIManager, Config, UserAccess, UserAccessTranslate
+from Code.tools import (
+    APIError,
+    APIManager,
+    AsyncAPIManager,
+    Config,
+    UserAccess,
+    UserAccessTranslate,
+)
 
 from .base_window import BaseWindow
 
@@ -13,6 +20,7 @@ logger = logging.getLogger(__name__)
 class UserAccessPanel(BaseWindow):
     _tag = "WindowUserAccessPanel"
     _user_list = []
+    _user_infos: dict[str, dict] = {}
     _group_ids = []
 
     @classmethod
@@ -55,17 +63,37 @@ class UserAccessPanel(BaseWindow):
             dpg.configure_item(group_id, show=visible)
 
     @classmethod
-    def _ref_users(cls) -> None:
-        cls._user_list = sorted(APIManager.user_control.get_all())
-        cls.render_btns()
-        cls._invoce_resize()
+    async def _load_users(cls) -> tuple[list[str], dict[str, dict]]:
+        logins = await AsyncAPIManager.user_control.get_all()
+        infos = await AsyncAPIManager.gather(
+            *(AsyncAPIManager.user_control.get_info(login) for login in logins)
+        )
+
+        return logins, {
+            login: info
+            for login, info in zip(logins, infos)
+            if isinstance(info, dict)
+        }
 
     @classmethod
-    def update_user_list(cls) -> None:
-        cls._user_list = sorted(APIManager.user_control.get_all())
+    def _ref_users(cls, force: bool = False) -> None:
+        if force:
+            APIManager.invalidate("user_control")
+
+        cls._run_async(cls._load_users(), on_done=cls._on_users)
+
+    @classmethod
+    def _on_users(cls, result: tuple[list[str], dict[str, dict]]) -> None:
+        users, cls._user_infos = result
+        cls._user_list = sorted(users)
+        cls.render_btns()
+        cls._invoce_resize()
 
     @classmethod
     def render_btns(cls) -> None:
+        if not dpg.does_item_exist(cls._tag):
+            return
+
         for item in cls._group_ids:
             if dpg.does_item_exist(item):
                 dpg.delete_item(item)
@@ -81,12 +109,20 @@ class UserAccessPanel(BaseWindow):
                 cls._group_ids.append(cur_group)
                 cur_item = 0
 
-            dpg.add_button(
+            btn_id = dpg.add_button(
                 label=item,
                 user_data=item,
                 parent=cur_group,
                 callback=lambda s, a, u: _UserInfoCard.create_user_card(u),
             )
+            if item in cls._user_infos:
+                with dpg.tooltip(btn_id):
+                    dpg.add_text(
+                        _UserInfoCard._get_preset_by_access(
+                            cls._user_infos[item]["access"]
+                        )
+                    )
+
             cur_item += 1
 
     @classmethod
@@ -95,8 +131,6 @@ class UserAccessPanel(BaseWindow):
             dpg.focus_item(cls._tag)
             return
 
-        cls.update_user_list()
-
         with dpg.window(
             tag=cls._tag,
             no_title_bar=True,
@@ -108,7 +142,10 @@ class UserAccessPanel(BaseWindow):
         ):
             with dpg.group(horizontal=True):
                 dpg.add_text("Управление пользователями")
-                dpg.add_button(label="Обновить список", callback=cls._ref_users)
+                dpg.add_button(
+                    label="Обновить список", callback=lambda: cls._ref_users(True)
+                )
+                cls._add_loading_text()
 
             dpg.add_separator()
 
@@ -119,9 +156,9 @@ class UserAccessPanel(BaseWindow):
             )
 
             dpg.add_separator()
-            cls.render_btns()
 
         super().create()
+        cls._ref_users()
 
     @classmethod
     def _on_del(cls) -> None:
@@ -195,6 +232,31 @@ class _UserInfoCard(BaseWindow):
     # endregion
 
     # region user_control
+    @classmethod
+    def _on_control_error(cls, err: Exception, forbidden_text: str) -> None:
+        head = "Ошибка"
+        body = ""
+        if isinstance(err, APIError) and err.code == 403:
+            head += " доступа"
+            body = forbidden_text
+        elif isinstance(err, APIError) and err.code == 404:
+            body = "Данного пользователя не существует."
+        else:
+            head += " сервера"
+            body = str(err)
+
+        cls._summon_popup(head, body)
+        cls._on_del()
+
+    @classmethod
+    def _on_access_set(cls, access: int) -> None:
+        login = cls._cur_user["login"]
+        if login in UserAccessPanel._user_infos:
+            UserAccessPanel._user_infos[login]["access"] = access
+
+        UserAccessPanel.render_btns()
+        cls._on_del()
+
     @classmethod
     def delete_user(cls, sender, app_data, user_data) -> None:
         if not (dpg.is_key_down(dpg.mvKey_LShift) or dpg.is_key_down(dpg.mvKey_RShift)):
@@ -204,44 +266,32 @@ class _UserInfoCard(BaseWindow):
             )
             return
 
-        try:
-            APIManager.user_control.delete(cls._cur_user["login"])
-            UserAccessPanel.update_user_list()
-            UserAccessPanel.render_btns()
-        except APIError as err:
-            head = "Ошибка"
-            body = ""
-            if err.code == 403:
-                head += " доступа"
-                body = "У вас недостаточно прав чтобы удалить данного пользователя."
-            elif err.code == 404:
-                body = "Данного пользователя не существует."
-            else:
-                head += " сервера"
-                body = str(err)
-
-            cls._summon_popup(head, body)
-        cls._on_del()
+        def on_done(_) -> None:
+            UserAccessPanel._ref_users()
+            cls._on_del()
+
+        UserAccessPanel._run_request(
+            APIManager.user_control.delete,
+            cls._cur_user["login"],
+            on_done=on_done,
+            on_error=lambda err: cls._on_control_error(
+                err, "У вас недостаточно прав чтобы удалить данного пользователя."
+            ),
+        )
 
     @classmethod
     def update_user(cls, sender, app_data, user_data) -> None:
         access = cls.collect_access_from_checkboxes()
-        try:
-            APIManager.user_control.set_access(cls._cur_user["login"], access)
-        except APIError as err:
-            head = "Ошибка"
-            body = ""
-            if err.code == 403:
-                head += " доступа"
-                body = "У вас недостаточно прав чтобы изменить выбранные права пользователя."
-            elif err.code == 404:
-                body = "Данного пользователя не существует."
-            else:
-                head += " сервера"
-                body = str(err)
-
-            cls._summon_popup(head, body)
-        cls._on_del()
+        UserAccessPanel._run_request(
+            APIManager.user_control.set_access,
+            cls._cur_user["login"],
+            access,
+            on_done=lambda _: cls._on_access_set(access),
+            on_error=lambda err: cls._on_control_error(
+                err,
+                "У вас недостаточно прав чтобы изменить выбранные права пользователя.",
+            ),
+        )
 
     @classmethod
     def clear_user_access(cls, sender, app_data, user_data) -> None:
@@ -252,22 +302,16 @@ class _UserInfoCard(BaseWindow):
             )
             return
 
-        try:
-            APIManager.user_control.set_access(cls._cur_user["login"], 0)
-        except APIError as err:
-            head = "Ошибка"
-            body = ""
-            if err.code == 403:
-                head += " доступа"
-                body = "У вас недостаточно прав чтобы изменить выбранные права пользователя."
-            elif err.code == 404:
-                body = "Данного пользователя не существует."
-            else:
-                head += " сервера"
-                body = str(err)
-
-            cls._summon_popup(head, body)
-        cls._on_del()
+        UserAccessPanel._run_request(
+            APIManager.user_control.set_access,
+            cls._cur_user["login"],
+            0,
+            on_done=lambda _: cls._on_access_set(0),
+            on_error=lambda err: cls._on_control_error(
+                err,
+                "У вас недостаточно прав чтобы изменить выбранные права пользователя.",
+            ),
+        )
 
     # endregion
 
@@ -296,24 +340,37 @@ class _UserInfoCard(BaseWindow):
 
     # endregion
 
+    @classmethod
+    def _on_card_error(cls, err: Exception) -> None:
+        if isinstance(err, APIError) and err.code == 404:
+            display_text = "Пользователь не найден"
+        else:
+            display_text = str(err)
+
+        cls._summon_popup(
+            "Ошибка получения данных",
+            display_text,
+        )
+
     @classmethod
     def create_user_card(cls, login: str) -> None:
         cls._on_del()
 
-        try:
-            cls._cur_user = APIManager.user_control.get_info(login)
+        if login in UserAccessPanel._user_infos:
+            cls._build_user_card(dict(UserAccessPanel._user_infos[login]))
+            return
 
-        except APIError as err:
-            if err.code == 404:
-                display_text = "Пользователь не найден"
-            else:
-                display_text = str(err)
+        UserAccessPanel._run_request(
+            APIManager.user_control.get_info,
+            login,
+            on_done=cls._build_user_card,
+            on_error=cls._on_card_error,
+        )
 
-            cls._summon_popup(
-                "Ошибка получения данных",
-                display_text,
-            )
-            return
+    @classmethod
+    def _build_user_card(cls, user_info: dict) -> None:
+        cls._on_del()
+        cls._cur_user = user_info
 
         with dpg.window(
             tag=cls._tag,
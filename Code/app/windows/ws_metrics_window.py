@@ -0,0 +1,106 @@
+import dearpygui.dearpygui as dpg
+
+from Code.tools import FrameTaskManager, TimerManager, WebSocketClient
+
+from .base_window import BaseWindow
+
+
+class WebSocketMetricsWindow(BaseWindow):
+    _tag = "WebSocketMetricsWindow"
+    _refresh_interval: float = 1.0
+
+    _columns: list[str] = [
+        "Событие",
+        "Всего",
+        "В сек.",
+        "Обработка ср., мс",
+        "p95, мс",
+        "Макс., мс",
+    ]
+
+    @classmethod
+    def _format_latency(cls, stats: dict[str, float]) -> str:
+        return (
+            f"ср. {stats['avg']:.2f} / p95 {stats['p95']:.2f} / "
+            f"макс. {stats['max']:.2f} мс ({stats['count']})"
+        )
+
+    @classmethod
+    def _refresh(cls) -> None:
+        if not dpg.does_item_exist(cls._tag):
+            return
+
+        metrics = WebSocketClient.metrics_snapshot()
+
+        dpg.set_value(
+            "ws_metrics_state",
+            f"Подключение: {'есть' if metrics['connected'] else 'нет'}, "
+            f"кодек: {metrics['codec']}, переподключений: {metrics['reconnects']}",
+        )
+        dpg.set_value(
+            "ws_metrics_queue",
+            f"Очередь: {metrics['queue_depth']} "
+            f"(макс. {metrics['max_queue_depth']}, отброшено {metrics['dropped']})",
+        )
+        dpg.set_value(
+            "ws_metrics_ping", "Пинг: " + cls._format_latency(metrics["ping"])
+        )
+        dpg.set_value(
+            "ws_metrics_decode",
+            "Декодирование: " + cls._format_latency(metrics["decode"]),
+        )
+
+        dpg.delete_item("ws_metrics_table", children_only=True, slot=1)
+        for event, stats in sorted(metrics["events"].items()):
+            handler = stats["handler"]
+            with dpg.table_row(parent="ws_metrics_table"):
+                dpg.add_text(event)
+                dpg.add_text(str(stats["count"]))
+                dpg.add_text(f"{stats['rate']:.1f}")
+                dpg.add_text(f"{handler['avg']:.2f}")
+                dpg.add_text(f"{handler['p95']:.2f}")
+                dpg.add_text(f"{handler['max']:.2f}")
+
+    @classmethod
+    def _reset(cls) -> None:
+        WebSocketClient.reset_metrics()
+        cls._refresh()
+
+    @classmethod
+    def create(cls) -> None:
+        if dpg.does_item_exist(cls._tag):
+            dpg.focus_item(cls._tag)
+            return
+
+        with dpg.window(
+            tag=cls._tag,
+            label="Метрики WebSocket",
+            width=620,
+            height=300,
+            pos=[80, 80],
+            on_close=cls._on_del,
+        ):
+            dpg.add_text("", tag="ws_metrics_state")
+            dpg.add_text("", tag="ws_metrics_queue")
+            dpg.add_text("", tag="ws_metrics_ping")
+            dpg.add_text("", tag="ws_metrics_decode")
+            dpg.add_button(label="Сбросить", callback=cls._reset)
+
+            with dpg.table(
+                policy=dpg.mvTable_SizingStretchProp,
+                borders_outerH=True,
+                borders_innerV=True,
+                borders_innerH=True,
+                borders_outerV=True,
+                tag="ws_metrics_table",
+            ):
+                for label in cls._columns:
+                    dpg.add_table_column(label=label)
+
+        cls._refresh()
+        TimerManager.add_timer(
+            cls._tag,
+            lambda: FrameTaskManager.post(cls._refresh, cls._tag),
+            cls._refresh_interval,
+        )
+        super().create()
@@ -0,0 +1,212 @@
+import importlib.abc
+import json
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ImportRecord:
+    name: str
+    start: float
+    duration: float = 0.0
+    children: list["_ImportRecord"] = field(default_factory=list)
+
+    @property
+    def self_time(self) -> float:
+        return self.duration - sum(child.duration for child in self.children)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "cumulative_ms": round(self.duration * 1000, 3),
+            "self_ms": round(self.self_time * 1000, 3),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class _TimingLoader(importlib.abc.Loader):
+    def __init__(self, loader: importlib.abc.Loader, name: str):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        stack = StartupProfiler._thread_stack()
+        record = _ImportRecord(self._name, time.perf_counter())
+        stack[-1].children.append(record)
+        stack.append(record)
+
+        try:
+            self._loader.exec_module(module)  # type: ignore
+
+        finally:
+            record.duration = time.perf_counter() - record.start
+            stack.pop()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimingLoader(spec.loader, fullname)  # type: ignore
+
+            return spec
+
+        return None
+
+
+class StartupProfiler:
+    # Imports that get their own section in the report
+    _tracked: list[str] = ["dearpygui", "requests", "websocket", "colorama", "yaml"]
+    _min_tree_ms: float = 1.0
+
+    _enabled: bool = False
+    _start: float = 0.0
+    _root: _ImportRecord = _ImportRecord("<startup>", 0.0)
+    _local: threading.local = threading.local()
+    _finder: _TimingFinder | None = None
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def enable(cls) -> None:
+        if cls._enabled:
+            return
+
+        cls._start = time.perf_counter()
+        cls._root = _ImportRecord("<startup>", cls._start)
+        cls._finder = _TimingFinder()
+        sys.meta_path.insert(0, cls._finder)
+        cls._enabled = True
+
+    @classmethod
+    def _thread_stack(cls) -> list[_ImportRecord]:
+        # Imports nest per thread, background threads hang off the root
+        stack = getattr(cls._local, "stack", None)
+        if stack is None:
+            stack = cls._local.stack = [cls._root]
+
+        return stack
+
+    @classmethod
+    def _stop_import_timing(cls) -> None:
+        if cls._finder in sys.meta_path:
+            sys.meta_path.remove(cls._finder)
+
+        cls._finder = None
+
+    @classmethod
+    def _tracked_imports(cls) -> dict[str, float]:
+        found: dict[str, float] = {}
+
+        def walk(record: _ImportRecord) -> None:
+            for child in record.children:
+                if child.name in cls._tracked and child.name not in found:
+                    found[child.name] = round(child.duration * 1000, 3)
+
+                walk(child)
+
+        walk(cls._root)
+        return found
+
+    @classmethod
+    def _tree_lines(cls, record: _ImportRecord, depth: int = 0) -> list[str]:
+        lines = []
+        for child in sorted(record.children, key=lambda r: r.duration, reverse=True):
+            if child.duration * 1000 < cls._min_tree_ms:
+                continue
+
+            lines.append(
+                f"{'  ' * depth}{child.duration * 1000:8.1f} ms "
+                f"(self {child.self_time * 1000:.1f} ms)  {child.name}"
+            )
+            lines.extend(cls._tree_lines(child, depth + 1))
+
+        return lines
+
+    @classmethod
+    def finish(
+        cls,
+        save_dir: Path,
+        setup_start: float,
+        phases: list[tuple[str, float, float]],
+        marks: dict[str, float],
+    ) -> None:
+        if not cls._enabled:
+            return
+
+        cls._stop_import_timing()
+        cls._enabled = False
+
+        offset = setup_start - cls._start
+        report = {
+            "generated": datetime.now().isoformat(),
+            "python": sys.version,
+            "total_ms": round((time.perf_counter() - cls._start) * 1000, 3),
+            "marks_ms": {
+                name: round(value + offset * 1000, 3) for name, value in marks.items()
+            },
+            "phases": [
+                {
+                    "name": name,
+                    "start_ms": round((start + offset) * 1000, 3),
+                    "duration_ms": round(duration * 1000, 3),
+                }
+                for name, start, duration in phases
+            ],
+            "tracked_imports_ms": cls._tracked_imports(),
+            "imports": [child.to_dict() for child in cls._root.children],
+        }
+
+        lines = [f"Startup profile, total {report['total_ms']:.1f} ms", ""]
+        lines.append("Marks:")
+        for name, value in report["marks_ms"].items():
+            lines.append(f"  {value:8.1f} ms  {name}")
+
+        lines += ["", "Phases:"]
+        for phase in report["phases"]:
+            lines.append(
+                f"  {phase['duration_ms']:8.1f} ms  {phase['name']} "
+                f"(at {phase['start_ms']:.1f} ms)"
+            )
+
+        lines += ["", "Tracked imports:"]
+        for name, value in report["tracked_imports_ms"].items():
+            lines.append(f"  {value:8.1f} ms  {name}")
+
+        lines += ["", f"Import tree (>= {cls._min_tree_ms} ms):"]
+        lines += ["  " + line for line in cls._tree_lines(cls._root)]
+
+        save_dir.mkdir(parents=True, exist_ok=True)
+        json_path = save_dir / "startup_profile.json"
+        text_path = save_dir / "startup_profile.txt"
+
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        logger.info(f"Startup profile written to {json_path} and {text_path}")
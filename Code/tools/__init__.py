@@ -8,8 +8,21 @@ from .api_manager import (
 )
 from .config import Config
 from .fonts_manager import FontManager
+from .frame_task_manager import FrameTaskManager
+from .log_store import LogStore
+from .retry_policy import CircuitBreaker, CircuitOpenError, RetryPolicy
 from .texture_manager import TextureManager
 from .themes_manager import ThemesManager
 from .timer_manager import TimerManager
 from .viewport_resize import ViewportResizeManager
-from .web_soket_client import WebSocketClient
+from .web_soket_client import EventPolicy, WebSocketClient
+
+
+def __getattr__(name: str):
+    # httpx alone costs ~90 ms, so the async client loads on first use
+    if name == "AsyncAPIManager":
+        from .async_api_manager import AsyncAPIManager
+
+        return AsyncAPIManager
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,23 @@
+import base64
+import copy
+import json
 import logging
-import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
+from threading import Lock
 from typing import Any, Literal
 
-from requests import Response, Session
+from requests import RequestException, Response, Session
+from requests.adapters import HTTPAdapter
 
 from .config import Config
+from .frame_task_manager import FrameTaskManager
+from .retry_policy import CircuitBreaker, RetryPolicy
+from .timer_manager import TimerManager
 from .web_soket_client import WebSocketClient
 
 logger = logging.getLogger(__name__)
@@ -135,6 +146,74 @@ class APIManager:
         "access": 0,
     }
 
+    _executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=4,
+        thread_name_prefix="APIManager",
+    )
+
+    _refresh_lock: Lock = Lock()
+    _refresh_future: Future | None = None
+    # Seconds before the access token expires to renew it in the background
+    _renew_margin: float = 60.0
+
+    _retry_policy: RetryPolicy = RetryPolicy()
+    _breaker_threshold: int = 5
+    _breaker_reset_timeout: float = 30.0
+    _breakers: dict[str, CircuitBreaker] = {}
+    # GET endpoints with side effects, never retried automatically
+    _unsafe_gets: set[str] = {
+        "/api/server_control/start",
+        "/api/server_control/stop",
+    }
+
+    _pool_connections: int = 4
+    _pool_maxsize: int = 16
+    # (connect, read) seconds per endpoint class
+    _timeouts: dict[str, tuple[float, float]] = {
+        "default": (3.05, 15.0),
+        "bulk": (3.05, 60.0),
+        "control": (3.05, 60.0),
+    }
+    _endpoint_classes: dict[str, str] = {
+        "/api/logs/by_creator": "bulk",
+        "/api/logs/by_range": "bulk",
+        "/api/logs/by_time_range": "bulk",
+        "/api/player_control/get": "bulk",
+        "/api/payment_control/list": "bulk",
+        "/api/server_control/start": "control",
+        "/api/server_control/stop": "control",
+    }
+
+    # Seconds a response stays fresh, keyed by endpoint path without a query
+    _cache_ttls: dict[str, float] = {
+        "download/version": 300,
+        "/api/user_control/get_all": 60,
+        "/api/user_control/get_info": 60,
+        "/api/player_control/get": 30,
+        "/api/lore_char_control/get": 60,
+        "/api/service_control/get": 60,
+        "/api/service_control/list": 60,
+        "/api/payment_control/get": 30,
+        "/api/payment_control/list": 30,
+    }
+    # POST endpoints that only read data and never invalidate the cache
+    _read_only_posts: set[str] = {
+        "/api/user_control/get_info",
+        "/api/service_control/get",
+        "/api/payment_control/get",
+        "/api/logs/by_creator",
+        "/api/logs/by_range",
+        "/api/logs/by_time_range",
+    }
+    _cache_size: int = 128
+    _cache: OrderedDict[tuple[str, str, str], tuple[float, Any]] = OrderedDict()
+    _cache_lock: Lock = Lock()
+    # Conditional request headers and the last body, keyed like the cache
+    _validator_size: int = 64
+    _validators: OrderedDict[tuple[str, str, str], tuple[dict[str, str], Any]] = (
+        OrderedDict()
+    )
+
     # region Base
     @classmethod
     def setup(cls) -> None:
@@ -144,6 +223,35 @@ class APIManager:
             }
         )
 
+        WebSocketClient.register_resubscribe(
+            "server_control_status", cls.server_control.status_subscribe
+        )
+        WebSocketClient.register_resubscribe("logs_new", cls.logs.subscribe)
+
+        cls._retry_policy = RetryPolicy(
+            attempts=Config.get("retry_attempts", 3),
+            base_delay=Config.get("retry_base_delay", 0.25),
+            max_delay=Config.get("retry_max_delay", 4.0),
+        )
+        cls._breaker_threshold = Config.get("circuit_failure_threshold", 5)
+        cls._breaker_reset_timeout = Config.get("circuit_reset_timeout", 30.0)
+        cls._breakers.clear()
+
+        for name, timeout in Config.get("http_timeouts", {}).items():
+            cls._timeouts[name] = (float(timeout[0]), float(timeout[1]))
+
+        adapter = HTTPAdapter(
+            pool_connections=Config.get("http_pool_connections", cls._pool_connections),
+            pool_maxsize=Config.get("http_pool_maxsize", cls._pool_maxsize),
+            max_retries=0,
+        )
+        cls._session.mount("https://", adapter)
+        cls._session.mount("http://", adapter)
+
+    @classmethod
+    def stop(cls) -> None:
+        cls._executor.shutdown(wait=False, cancel_futures=True)
+
     @classmethod
     def _update_auth_headers(
         cls,
@@ -162,6 +270,62 @@ class APIManager:
         if headers:
             cls._session.headers.update(headers)
 
+        if access_token:
+            WebSocketClient.set_auth(headers["Authorization"])
+            cls._schedule_renewal(access_token)
+
+    @staticmethod
+    def _token_claims(access_token: str) -> dict:
+        try:
+            payload = access_token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            return claims if isinstance(claims, dict) else {}
+
+        except Exception:
+            return {}
+
+    @classmethod
+    def _schedule_renewal(cls, access_token: str) -> None:
+        TimerManager.remove_timer("api_token_renewal")
+
+        claims = cls._token_claims(access_token)
+        try:
+            exp = float(claims["exp"])
+            iat = float(claims["iat"]) if "iat" in claims else None
+
+        except (KeyError, TypeError, ValueError):
+            return
+
+        if iat is not None and exp > iat:
+            # Lifetime from the token itself, so local clock skew does not matter
+            lifetime = exp - iat
+
+        else:
+            lifetime = exp - time.time()
+            if lifetime <= cls._renew_margin:
+                logger.warning(
+                    f"Access token expires in {lifetime:.0f}s by the local clock, "
+                    "skipping background renewal"
+                )
+                return
+
+        delay = lifetime - min(cls._renew_margin, lifetime / 2)
+        auth = f"Bearer {access_token}"
+
+        TimerManager.add_timer(
+            "api_token_renewal", lambda: cls._renew(auth), delay, repeat_count=1
+        )
+        logger.debug(f"Access token renewal scheduled in {delay:.0f}s")
+
+    @classmethod
+    def _renew(cls, auth: str) -> None:
+        try:
+            cls._refresh_once(auth)
+
+        except Exception as e:
+            logger.warning(f"Background token renewal failed: {e}")
+
     @classmethod
     def _response_sanity_check(cls, response: Response) -> Any:
         if not response.ok:
@@ -187,31 +351,343 @@ class APIManager:
         _retry: bool = True,
         **kwargs,
     ):
+        hit, cached = cls._cache_get(method, url, kwargs)
+        if hit:
+            return cached
+
+        auth = cls._session.headers.get("Authorization")
         try:
-            response = cls._session.request(method, cls._base_url + url, **kwargs)
-            return cls._response_sanity_check(response)
+            result = cls._send_with_retry(method, url, kwargs)
+            cls._cache_store(method, url, kwargs, result)
+            return result
 
         except APIError as err:
-            if str(err) == "Token expired":
-                if _retry:
-                    cls._refresh()
-                    return cls._requests(method, url, False, **kwargs)
+            if str(err) == "Token expired" and _retry:
+                cls._refresh_once(auth)
+                return cls._requests(method, url, False, **kwargs)
 
-                else:
-                    sys.exit(1)
+            raise err
 
-            else:
-                raise err
+    @classmethod
+    def _timeout_for(cls, url: str) -> tuple[float, float]:
+        endpoint_class = cls._endpoint_classes.get(cls._endpoint(url), "default")
+        return cls._timeouts.get(endpoint_class, cls._timeouts["default"])
+
+    @classmethod
+    def _send(cls, method: str, url: str, kwargs: dict[str, Any]) -> Any:
+        kwargs = {"timeout": cls._timeout_for(url), **kwargs}
+        response = cls._session.request(
+            method, cls._base_url + url, **cls._with_validators(method, url, kwargs)
+        )
+
+        if response.status_code == 304:
+            hit, result = cls._not_modified(method, url, kwargs)
+            if hit:
+                return result
+
+            response = cls._session.request(method, cls._base_url + url, **kwargs)
+
+        result = cls._response_sanity_check(response)
+        cls._remember_validators(method, url, kwargs, response.headers, result)
+        return result
+
+    @classmethod
+    def _refresh_once(cls, stale_auth: str | bytes | None) -> None:
+        # Concurrent callers share one refresh instead of racing on the token file
+        with cls._refresh_lock:
+            if cls._session.headers.get("Authorization") != stale_auth:
+                return
+
+            future = cls._refresh_future
+            owner = future is None
+            if future is None:
+                future = cls._refresh_future = Future()
+
+        if owner:
+            try:
+                cls._refresh()
+                future.set_result(None)
+
+            except Exception as e:
+                future.set_exception(e)
+
+            finally:
+                with cls._refresh_lock:
+                    cls._refresh_future = None
+
+        future.result()
 
     @classmethod
     def _refresh(cls) -> None:
-        response = cls._session.get(cls._base_url + "api/auth/refresh")
+        response = cls._session.get(
+            cls._base_url + "api/auth/refresh", timeout=cls._timeout_for("api/auth")
+        )
         json_data = cls._response_sanity_check(response)
 
         cls._update_auth_headers(**json_data)
 
     # endregion
 
+    # region Retry
+    @classmethod
+    def _is_idempotent(cls, method: str, url: str) -> bool:
+        endpoint = cls._endpoint(url)
+        if method == "GET":
+            return endpoint not in cls._unsafe_gets
+
+        return endpoint in cls._read_only_posts
+
+    @classmethod
+    def _breaker(cls) -> CircuitBreaker:
+        breaker = cls._breakers.get(cls._base_domain)
+        if breaker is None:
+            breaker = cls._breakers[cls._base_domain] = CircuitBreaker(
+                cls._base_domain,
+                failure_threshold=cls._breaker_threshold,
+                reset_timeout=cls._breaker_reset_timeout,
+            )
+
+        return breaker
+
+    @classmethod
+    def _should_retry(
+        cls, method: str, url: str, attempt: int, status: int | None
+    ) -> bool:
+        if not cls._is_idempotent(method, url):
+            return False
+
+        return cls._retry_policy.should_retry(attempt, status)
+
+    @classmethod
+    def _retry_delay(
+        cls,
+        breaker: CircuitBreaker,
+        method: str,
+        url: str,
+        attempt: int,
+        err: Exception,
+    ) -> float | None:
+        # The breaker counts logical requests, so it is settled once per request
+        status = err.code if isinstance(err, APIError) else None
+        if status is not None and status < 500:
+            breaker.record_success()
+            return None
+
+        if not cls._should_retry(method, url, attempt, status):
+            breaker.record_failure()
+            return None
+
+        delay = cls._retry_policy.delay(attempt)
+        logger.debug(f"Retrying {method} {url} in {delay:.2f}s: {err}")
+        return delay
+
+    @classmethod
+    def _send_with_retry(cls, method: str, url: str, kwargs: dict[str, Any]) -> Any:
+        breaker = cls._breaker()
+        breaker.before_request()
+        attempt = 0
+
+        while True:
+            try:
+                result = cls._send(method, url, kwargs)
+
+            except (APIError, RequestException) as err:
+                delay = cls._retry_delay(breaker, method, url, attempt, err)
+                if delay is None:
+                    raise
+
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            except Exception:
+                breaker.record_success()
+                raise
+
+            breaker.record_success()
+            return result
+
+    # endregion
+
+    # region Cache
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        return url.split("?", 1)[0]
+
+    @staticmethod
+    def _namespace(url: str) -> str:
+        parts = url.strip("/").split("/")
+        if parts[0] == "api" and len(parts) > 1:
+            return parts[1]
+
+        return parts[0]
+
+    @classmethod
+    def _cache_key(
+        cls, method: str, url: str, kwargs: dict[str, Any]
+    ) -> tuple[str, str, str]:
+        body = json.dumps(
+            [kwargs.get("json"), kwargs.get("params")], sort_keys=True, default=str
+        )
+        return method, url, body
+
+    @classmethod
+    def _cache_get(
+        cls, method: str, url: str, kwargs: dict[str, Any]
+    ) -> tuple[bool, Any]:
+        if cls._endpoint(url) not in cls._cache_ttls:
+            return False, None
+
+        key = cls._cache_key(method, url, kwargs)
+        with cls._cache_lock:
+            entry = cls._cache.get(key)
+            if entry is None:
+                return False, None
+
+            expires, value = entry
+            if expires < time.monotonic():
+                del cls._cache[key]
+                return False, None
+
+            cls._cache.move_to_end(key)
+
+        return True, copy.deepcopy(value)
+
+    @classmethod
+    def _cache_store(
+        cls, method: str, url: str, kwargs: dict[str, Any], value: Any
+    ) -> None:
+        endpoint = cls._endpoint(url)
+        ttl = cls._cache_ttls.get(endpoint)
+
+        if ttl is None:
+            if method == "POST" and endpoint not in cls._read_only_posts:
+                cls.invalidate(cls._namespace(url))
+            return
+
+        key = cls._cache_key(method, url, kwargs)
+        with cls._cache_lock:
+            cls._cache[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+            cls._cache.move_to_end(key)
+
+            while len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def _with_validators(
+        cls, method: str, url: str, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        if method != "GET":
+            return kwargs
+
+        with cls._cache_lock:
+            entry = cls._validators.get(cls._cache_key(method, url, kwargs))
+
+        if entry is None:
+            return kwargs
+
+        return {**kwargs, "headers": {**entry[0], **kwargs.get("headers", {})}}
+
+    @classmethod
+    def _remember_validators(
+        cls,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+        headers: Any,
+        value: Any,
+    ) -> None:
+        if method != "GET":
+            return
+
+        validators = {}
+        if etag := headers.get("ETag"):
+            validators["If-None-Match"] = etag
+
+        if last_modified := headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+
+        key = cls._cache_key(method, url, kwargs)
+        with cls._cache_lock:
+            if not validators:
+                cls._validators.pop(key, None)
+                return
+
+            cls._validators[key] = (validators, copy.deepcopy(value))
+            cls._validators.move_to_end(key)
+
+            while len(cls._validators) > cls._validator_size:
+                cls._validators.popitem(last=False)
+
+    @classmethod
+    def _not_modified(
+        cls, method: str, url: str, kwargs: dict[str, Any]
+    ) -> tuple[bool, Any]:
+        key = cls._cache_key(method, url, kwargs)
+        with cls._cache_lock:
+            entry = cls._validators.get(key)
+            if entry is None:
+                return False, None
+
+            cls._validators.move_to_end(key)
+
+        return True, copy.deepcopy(entry[1])
+
+    @classmethod
+    def invalidate(cls, namespace: str | None = None) -> None:
+        with cls._cache_lock:
+            if namespace is None:
+                cls._cache.clear()
+                cls._validators.clear()
+                return
+
+            for key in [k for k in cls._cache if cls._namespace(k[1]) == namespace]:
+                del cls._cache[key]
+
+    # endregion
+
+    # region Background
+    @classmethod
+    def submit(
+        cls,
+        func: Callable[..., Any],
+        *args,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        **kwargs,
+    ) -> Future:
+        future = cls._executor.submit(func, *args, **kwargs)
+        return cls.watch(future, on_done, on_error, func.__qualname__)
+
+    @classmethod
+    def watch(
+        cls,
+        future: Future,
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        name: str = "",
+    ) -> Future:
+        def done_callback(fut: Future) -> None:
+            if fut.cancelled():
+                return
+
+            err = fut.exception()
+            if err is None:
+                if on_done is not None:
+                    result = fut.result()
+                    FrameTaskManager.post(lambda: on_done(result))
+
+            elif on_error is not None:
+                FrameTaskManager.post(lambda: on_error(err))  # type: ignore
+
+            else:
+                logger.error(f"Error in background request {name}: {err}")
+
+        future.add_done_callback(done_callback)
+        return future
+
+    # endregion
+
     # region etc
     @classmethod
     def has_access(cls, value: int) -> bool:
@@ -293,7 +769,9 @@ class APIManager:
 
         @classmethod
         def logout(cls) -> None:
+            TimerManager.remove_timer("api_token_renewal")
             Config.set_refresh_token_to_file("")
+            APIManager.invalidate()
             cls.cur_user = {
                 "login": "",
                 "access": 0,
@@ -345,6 +823,7 @@ class APIManager:
 
         @classmethod
         def status_subscribe(cls) -> dict[str, str]:
+            WebSocketClient.wait_ready()
             return APIManager._requests("GET", "/api/server_control/status/subscribe")
 
         @classmethod
@@ -507,6 +986,15 @@ class APIManager:
         def min_max_id(cls) -> dict[str, int]:
             return APIManager._requests("GET", "/api/logs/min_max_id")
 
+        @classmethod
+        def subscribe(cls) -> dict[str, str]:
+            WebSocketClient.wait_ready()
+            return APIManager._requests("GET", "/api/logs/subscribe")
+
+        @classmethod
+        def unsubscribe(cls) -> dict[str, str]:
+            return APIManager._requests("GET", "/api/logs/unsubscribe")
+
     class service_control:
         @classmethod
         def create(
@@ -0,0 +1,576 @@
+import asyncio
+import atexit
+import logging
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import Future
+from datetime import datetime
+from threading import Event, Thread
+from typing import Any, Literal
+
+import httpx
+
+from .api_manager import APIError, APIManager
+from .config import Config
+from .web_soket_client import WebSocketClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPIManager:
+    _max_connections: int = 8
+    _max_keepalive_connections: int = 8
+    _keepalive_expiry: float = 30.0
+
+    _loop: asyncio.AbstractEventLoop | None = None
+    _thread: Thread | None = None
+    _client: httpx.AsyncClient | None = None
+
+    # region Base
+    @classmethod
+    def setup(cls) -> None:
+        if cls._loop is not None:
+            return
+
+        loop_ready = Event()
+
+        def loop_worker() -> None:
+            cls._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(cls._loop)
+            loop_ready.set()
+            cls._loop.run_forever()
+
+        cls._max_connections = Config.get("http_max_connections", cls._max_connections)
+        cls._max_keepalive_connections = Config.get(
+            "http_max_keepalive_connections", cls._max_keepalive_connections
+        )
+        cls._keepalive_expiry = Config.get(
+            "http_keepalive_expiry", cls._keepalive_expiry
+        )
+
+        cls._thread = Thread(target=loop_worker, name="AsyncAPIManager", daemon=True)
+        cls._thread.start()
+        loop_ready.wait()
+
+        cls.run(cls._create_client()).result()
+        atexit.register(cls.stop)
+
+    @classmethod
+    def stop(cls) -> None:
+        if cls._loop is None:
+            return
+
+        try:
+            cls.run(cls._close_client()).result(timeout=5)
+
+        except Exception as e:
+            logger.error(f"Failed to close async client: {e}")
+
+        cls._loop.call_soon_threadsafe(cls._loop.stop)
+        if cls._thread:
+            cls._thread.join()
+
+        cls._loop = None
+        cls._thread = None
+
+    @classmethod
+    async def _create_client(cls) -> None:
+        cls._client = httpx.AsyncClient(
+            base_url=APIManager._base_url,
+            limits=httpx.Limits(
+                max_connections=cls._max_connections,
+                max_keepalive_connections=cls._max_keepalive_connections,
+                keepalive_expiry=cls._keepalive_expiry,
+            ),
+        )
+
+    @classmethod
+    async def _close_client(cls) -> None:
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+    @classmethod
+    def run(cls, coro: Coroutine[Any, Any, Any]) -> Future:
+        if cls._loop is None:
+            raise RuntimeError("AsyncAPIManager is not set up")
+
+        return asyncio.run_coroutine_threadsafe(coro, cls._loop)
+
+    @classmethod
+    def submit(
+        cls,
+        coro: Coroutine[Any, Any, Any],
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> Future:
+        return APIManager.watch(cls.run(coro), on_done, on_error, coro.__qualname__)
+
+    @classmethod
+    async def gather(cls, *aws: Awaitable[Any]) -> list[Any]:
+        return await asyncio.gather(*aws, return_exceptions=True)
+
+    @classmethod
+    def _response_sanity_check(cls, response: httpx.Response) -> Any:
+        if not response.is_success:
+            try:
+                error_detail = response.json().get("detail", response.text)
+
+            except Exception:
+                error_detail = response.text
+
+            raise APIError(error_detail, response.status_code)
+
+        try:
+            return response.json()
+
+        except Exception:
+            raise ValueError("Response does not contain json")
+
+    @classmethod
+    async def _request(cls, method: str, url: str, kwargs: dict[str, Any]):
+        kwargs = dict(kwargs)
+        headers = {**APIManager._session.headers, **kwargs.pop("headers", {})}
+        connect, read = APIManager._timeout_for(url)
+        return await cls._client.request(  # type: ignore
+            method,
+            url,
+            headers=headers,
+            timeout=httpx.Timeout(read, connect=connect),
+            **kwargs,
+        )
+
+    @classmethod
+    async def _send(cls, method: str, url: str, kwargs: dict[str, Any]) -> Any:
+        response = await cls._request(
+            method, url, APIManager._with_validators(method, url, kwargs)
+        )
+
+        if response.status_code == 304:
+            hit, result = APIManager._not_modified(method, url, kwargs)
+            if hit:
+                return result
+
+            response = await cls._request(method, url, kwargs)
+
+        result = cls._response_sanity_check(response)
+        APIManager._remember_validators(
+            method, url, kwargs, response.headers, result
+        )
+        return result
+
+    @classmethod
+    async def _send_with_retry(
+        cls, method: str, url: str, kwargs: dict[str, Any]
+    ) -> Any:
+        breaker = APIManager._breaker()
+        breaker.before_request()
+        attempt = 0
+
+        while True:
+            try:
+                result = await cls._send(method, url, kwargs)
+
+            except (APIError, httpx.TransportError) as err:
+                delay = APIManager._retry_delay(breaker, method, url, attempt, err)
+                if delay is None:
+                    raise
+
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            except Exception:
+                breaker.record_success()
+                raise
+
+            breaker.record_success()
+            return result
+
+    @classmethod
+    async def _requests(
+        cls,
+        method: Literal["GET", "POST"],
+        url: str,
+        _retry: bool = True,
+        **kwargs,
+    ):
+        if cls._client is None:
+            raise RuntimeError("AsyncAPIManager is not set up")
+
+        hit, cached = APIManager._cache_get(method, url, kwargs)
+        if hit:
+            return cached
+
+        auth = APIManager._session.headers.get("Authorization")
+        try:
+            result = await cls._send_with_retry(method, url, kwargs)
+            APIManager._cache_store(method, url, kwargs, result)
+            return result
+
+        except APIError as err:
+            if str(err) == "Token expired" and _retry:
+                await asyncio.to_thread(APIManager._refresh_once, auth)
+                return await cls._requests(method, url, False, **kwargs)
+
+            raise err
+
+    # endregion
+
+    class download:
+        @classmethod
+        async def version(cls) -> str | None:
+            try:
+                json_data = await AsyncAPIManager._requests("GET", "download/version")
+                return json_data.get("version", None)
+
+            except Exception:
+                return None
+
+    class user_control:
+        @classmethod
+        async def me(cls) -> dict:
+            return await AsyncAPIManager._requests("GET", "/api/user_control/me")
+
+        @classmethod
+        async def get_info(cls, target: str) -> dict:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/user_control/get_info",
+                json={"target": target},
+            )
+
+        @classmethod
+        async def get_all(cls) -> list:
+            json_data = await AsyncAPIManager._requests(
+                "GET", "/api/user_control/get_all"
+            )
+            return json_data.get("logins", [])
+
+        @classmethod
+        async def delete(cls, target: str) -> None:
+            await AsyncAPIManager._requests(
+                "POST", "/api/user_control/delete", json={"target": target}
+            )
+
+        @classmethod
+        async def set_access(cls, target: str, access: int) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/user_control/set_access",
+                json={"target": target, "access": access},
+            )
+
+    class server_control:
+        @classmethod
+        async def start(cls) -> None:
+            await AsyncAPIManager._requests("GET", "/api/server_control/start")
+
+        @classmethod
+        async def stop(cls) -> None:
+            await AsyncAPIManager._requests("GET", "/api/server_control/stop")
+
+        @classmethod
+        async def status(cls) -> str:
+            json_data = await AsyncAPIManager._requests(
+                "GET", "/api/server_control/status"
+            )
+            return json_data.get("status")
+
+        @classmethod
+        async def status_subscribe(cls) -> dict[str, str]:
+            await asyncio.to_thread(WebSocketClient.wait_ready)
+            return await AsyncAPIManager._requests(
+                "GET", "/api/server_control/status/subscribe"
+            )
+
+        @classmethod
+        async def status_unsubscribe(cls) -> dict[str, str]:
+            return await AsyncAPIManager._requests(
+                "GET", "/api/server_control/status/unsubscribe"
+            )
+
+    class player_control:
+        @classmethod
+        async def create(cls, discord_name: str, steam_url: str) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/player_control/create",
+                json={
+                    "discord_name": discord_name,
+                    "steam_url": steam_url,
+                },
+            )
+
+        @classmethod
+        async def get(
+            cls,
+            discord_id: str | None = None,
+            steam_id: str | None = None,
+        ) -> list[dict]:
+            params = {}
+            if discord_id:
+                params["discord_id"] = discord_id
+            if steam_id:
+                params["steam_id"] = steam_id
+
+            return await AsyncAPIManager._requests(
+                "GET", "/api/player_control/get", params=params
+            )
+
+        @classmethod
+        async def edit(
+            cls,
+            u_id: int,
+            discord_name: str | None,
+            blacklist: dict[str, bool] | None,
+            mb_limit: float | None,
+            mb_taken: float | None,
+        ) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/player_control/edit",
+                json={
+                    "u_id": u_id,
+                    "discord_name": discord_name,
+                    "blacklist": blacklist,
+                    "mb_limit": mb_limit,
+                    "mb_taken": mb_taken,
+                },
+            )
+
+        @classmethod
+        async def add_note(cls, u_id: int, text: str) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/player_control/note/add",
+                json={
+                    "u_id": u_id,
+                    "text": text,
+                },
+            )
+
+        @classmethod
+        async def change_note_status(cls, u_id: int, index: int, status: str) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/player_control/note/status",
+                json={
+                    "u_id": u_id,
+                    "index": index,
+                    "status": status,
+                },
+            )
+
+    class lore_char_control:
+        @classmethod
+        async def get(cls) -> dict[str, Any]:
+            return await AsyncAPIManager._requests("GET", "/api/lore_char_control/get")
+
+        @classmethod
+        async def create(
+            cls,
+            key: str,
+            name: str,
+            status: Literal["free", "taken", "blocked"],
+            wiki: str | None,
+        ) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/lore_char_control/create",
+                json={
+                    "key": key,
+                    "name": name,
+                    "status": status,
+                    "wiki": wiki,
+                },
+            )
+
+        @classmethod
+        async def edit(
+            cls,
+            key: str,
+            name: str,
+            status: Literal["free", "taken", "blocked"],
+            wiki: str | None,
+        ) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/lore_char_control/edit",
+                json={
+                    "key": key,
+                    "name": name,
+                    "status": status,
+                    "wiki": wiki,
+                },
+            )
+
+        @classmethod
+        async def delete(cls, key: str) -> None:
+            await AsyncAPIManager._requests(
+                "POST",
+                "/api/lore_char_control/delete",
+                json={"key": key},
+            )
+
+    class logs:
+        @classmethod
+        async def by_creator(cls, creator: str) -> list[dict[str, Any]]:
+            return await AsyncAPIManager._requests(
+                "POST", "/api/logs/by_creator", json={"target": creator}
+            )
+
+        @classmethod
+        async def by_range(cls, start_id: int, end_id: int) -> list[dict[str, Any]]:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/logs/by_range",
+                json={"start_id": start_id, "end_id": end_id},
+            )
+
+        @classmethod
+        async def by_time_range(
+            cls,
+            start_time: datetime,
+            end_time: datetime,
+        ) -> list[dict[str, Any]]:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/logs/by_time_range",
+                json={"start_time": start_time, "end_time": end_time},
+            )
+
+        @classmethod
+        async def min_max_id(cls) -> dict[str, int]:
+            return await AsyncAPIManager._requests("GET", "/api/logs/min_max_id")
+
+        @classmethod
+        async def subscribe(cls) -> dict[str, str]:
+            await asyncio.to_thread(WebSocketClient.wait_ready)
+            return await AsyncAPIManager._requests("GET", "/api/logs/subscribe")
+
+        @classmethod
+        async def unsubscribe(cls) -> dict[str, str]:
+            return await AsyncAPIManager._requests("GET", "/api/logs/unsubscribe")
+
+    class service_control:
+        @classmethod
+        async def create(
+            cls,
+            name: str,
+            description: str,
+            price_main: str,
+            discount_value: int = 0,
+            discount_date: str | None = None,
+            status: Literal["on", "off", "archive"] = "off",
+            left: int | None = None,
+            sell_time: str | None = None,
+            oferta_limit: bool = False,
+        ) -> dict:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/service_control/create",
+                json={
+                    "name": name,
+                    "description": description,
+                    "price_main": price_main,
+                    "discount_value": discount_value,
+                    "discount_date": discount_date,
+                    "status": status,
+                    "left": left,
+                    "sell_time": sell_time,
+                    "oferta_limit": oferta_limit,
+                },
+            )
+
+        @classmethod
+        async def delete(cls, u_id: str) -> dict:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/service_control/delete",
+                json={"u_id": u_id},
+            )
+
+        @classmethod
+        async def edit(cls, u_id: str, **fields) -> dict:
+            payload = {"u_id": u_id}
+            payload.update(fields)
+
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/service_control/edit",
+                json=payload,
+            )
+
+        @classmethod
+        async def get(cls, u_id: str) -> dict:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/service_control/get",
+                json={"u_id": str(u_id)},
+            )
+
+        @classmethod
+        async def list(cls) -> list[dict]:
+            return await AsyncAPIManager._requests("GET", "/api/service_control/list")
+
+    class payment_control:
+        @classmethod
+        async def create(
+            cls,
+            player_id: str,
+            items: list[dict],
+            commission_key: str = "AC",
+            status: str = "pending",
+        ) -> dict:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/payment_control/create",
+                json={
+                    "player_id": player_id,
+                    "items": items,
+                    "commission_key": commission_key,
+                    "status": status,
+                },
+            )
+
+        @classmethod
+        async def delete(cls, u_id: str) -> dict:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/payment_control/delete",
+                json={"u_id": u_id},
+            )
+
+        @classmethod
+        async def edit(
+            cls,
+            u_id: str,
+            status: str | None = None,
+            player_id: str | None = None,
+            commission_key: str | None = None,
+        ) -> dict:
+            payload: dict = {"u_id": u_id}
+            if status is not None:
+                payload["status"] = status
+            if player_id is not None:
+                payload["player_id"] = player_id
+            if commission_key is not None:
+                payload["commission_key"] = commission_key
+
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/payment_control/edit",
+                json=payload,
+            )
+
+        @classmethod
+        async def get(cls, u_id: str) -> dict:
+            return await AsyncAPIManager._requests(
+                "POST",
+                "/api/payment_control/get",
+                json={"u_id": u_id},
+            )
+
+        @classmethod
+        async def list(cls) -> list[dict]:
+            return await AsyncAPIManager._requests("GET", "/api/payment_control/list")
@@ -1,9 +1,9 @@
+import hashlib
 import json
 import logging
 import os
 import platform
 import shutil
-from atexit import register
 from copy import deepcopy
 from pathlib import Path
 from platform import system
@@ -19,6 +19,10 @@ class Config:
     app_version: Final[str] = "v0.2.2"
     _config_serl_ver: Final[str] = "1"
 
+    _data_dir_str: str | None = None
+    _data_cache_name: Final[str] = "spf_data_cache"
+    _data_manifest_name: Final[str] = ".manifest.json"
+
     # region colors
     accent_color: Final[list[int]] = [255, 165, 0, 255]
 
@@ -79,34 +83,93 @@ class Config:
 
     @classmethod
     def get_data_dir_str(cls) -> str:
-        path = cls._root_dir / "Data"
-        path_str = str(path)
-
-        if system() == "Windows" and not path_str.isascii():
-            # Since our DPG does not digest non-ascii path's,
-            # we create a folder in the root of the disk where the script is located
-            # and then delete it when we finish our work
-            temp_folder = Path(path.anchor) / "spf_temp_data"
-            temp_folder.mkdir(exist_ok=True)
-
-            shutil.copytree(path, temp_folder, dirs_exist_ok=True)
-
-            def clean_up_font_fold():
-                try:
-                    shutil.rmtree(temp_folder)
+        if cls._data_dir_str is None:
+            cls._data_dir_str = str(cls.resolve_data_dir(cls.get_data_path(), system()))
 
-                except Exception:
-                    pass
+        return cls._data_dir_str
 
-            register(clean_up_font_fold)
-            path_str = str(temp_folder)
-
-        @classmethod
-        def tmp(cls) -> str:
-            return path_str
+    @classmethod
+    def resolve_data_dir(
+        cls,
+        path: Path,
+        system_name: str,
+        cache_dir: Path | None = None,
+    ) -> Path:
+        if system_name != "Windows" or str(path).isascii():
+            return path
+
+        # Since our DPG does not digest non-ascii path's,
+        # we keep a copy of the data in the root of the disk where the script is
+        # located and only refresh the files that changed since the last launch
+        if cache_dir is None:
+            cache_dir = Path(path.anchor) / cls._data_cache_name
+
+        cls.sync_data_cache(path, cache_dir)
+        return cache_dir
+
+    @staticmethod
+    def _file_hash(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
 
-        cls.get_data_dir_str = tmp
-        return path_str
+    @classmethod
+    def sync_data_cache(cls, source: Path, target: Path) -> int:
+        manifest_file = target / cls._data_manifest_name
+        try:
+            manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+
+        except (OSError, ValueError):
+            manifest = {}
+
+        new_manifest: dict[str, dict[str, Any]] = {}
+        copied = 0
+
+        for file in source.rglob("*"):
+            if not file.is_file():
+                continue
+
+            rel = file.relative_to(source).as_posix()
+            stat = file.stat()
+            dest = target / rel
+            entry = manifest.get(rel)
+            in_place = dest.is_file() and dest.stat().st_size == stat.st_size
+
+            # Unchanged size and mtime means the hash can't have changed either
+            if (
+                entry is not None
+                and in_place
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+            ):
+                new_manifest[rel] = entry
+                continue
+
+            file_hash = cls._file_hash(file)
+            if entry is None or entry["sha256"] != file_hash or not in_place:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(file, dest)
+                copied += 1
+
+            new_manifest[rel] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_hash,
+            }
+
+        for rel in manifest.keys() - new_manifest.keys():
+            (target / rel).unlink(missing_ok=True)
+
+        target.mkdir(parents=True, exist_ok=True)
+        manifest_file.write_text(json.dumps(new_manifest), encoding="utf-8")
+
+        if copied:
+            logger.info(f"Copied {copied} changed data file(s) to {target}")
+
+        return copied
 
     @classmethod
     def get_data_path(cls) -> Path:
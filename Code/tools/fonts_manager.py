@@ -4,16 +4,43 @@ from .config import Config
 
 
 class FontManager:
+    _font_size: int = 13
+
+    # Glyphs the UI actually uses: Basic Latin, the Russian alphabet,
+    # common typographic punctuation and the page arrows
+    _ranges: list[tuple[int, int]] = [
+        (0x0020, 0x007E),
+        (0x0410, 0x044F),
+    ]
+    _chars: list[int] = [
+        0x0401,  # Ё
+        0x0451,  # ё
+        0x00A0,  # no-break space
+        0x00AB,  # «
+        0x00BB,  # »
+        0x00B0,  # °
+        0x2013,  # –
+        0x2014,  # —
+        0x2026,  # …
+        0x2116,  # №
+        0x2190,  # ←
+        0x2192,  # →
+    ]
+
     @classmethod
     def load_fonts(cls):
         font_path = Config.get_data_dir_str() + "\\fonts\\Monocraft\\Monocraft.otf"
 
         with dpg.font_registry():
-            with dpg.font(font_path, 13) as default_font:
-                dpg.add_font_range_hint(dpg.mvFontRangeHint_Default)
-                dpg.add_font_range_hint(dpg.mvFontRangeHint_Cyrillic)
-                
-                # ←, →
-                dpg.add_font_chars([0x2190, 0x2192])
+            with dpg.font(font_path, cls._font_size) as default_font:
+                if Config.get("full_font_ranges", False):
+                    dpg.add_font_range_hint(dpg.mvFontRangeHint_Default)
+                    dpg.add_font_range_hint(dpg.mvFontRangeHint_Cyrillic)
+
+                else:
+                    for first, last in cls._ranges:
+                        dpg.add_font_range(first, last)
+
+                dpg.add_font_chars(cls._chars)
 
         dpg.bind_font(default_font)
@@ -0,0 +1,53 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+class FrameTaskManager:
+    _frame_budget: float = 0.004
+
+    _queue: deque[tuple[str | None, Callable[[], None]]] = deque()
+    _keyed: dict[str, Callable[[], None]] = {}
+    _lock: Lock = Lock()
+
+    @classmethod
+    def set_frame_budget(cls, seconds: float) -> None:
+        cls._frame_budget = max(0.0, seconds)
+
+    @classmethod
+    def post(cls, func: Callable[[], None], key: str | None = None) -> None:
+        with cls._lock:
+            if key is not None:
+                if key in cls._keyed:
+                    cls._keyed[key] = func
+                    return
+
+                cls._keyed[key] = func
+
+            cls._queue.append((key, func))
+
+    @classmethod
+    def process(cls) -> None:
+        deadline = time.perf_counter() + cls._frame_budget
+
+        while True:
+            with cls._lock:
+                if not cls._queue:
+                    return
+
+                key, func = cls._queue.popleft()
+                if key is not None:
+                    func = cls._keyed.pop(key, func)
+
+            try:
+                func()
+
+            except Exception as e:
+                logger.error(f"Error in frame task: {e}")
+
+            if time.perf_counter() >= deadline:
+                return
@@ -0,0 +1,228 @@
+import json
+import logging
+import sqlite3
+from threading import Lock
+from typing import Any
+
+from .api_manager import APIManager, LogType
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class LogStore:
+    _db_name: str = "logs.sqlite3"
+    _sync_chunk: int = 500
+
+    _conn: sqlite3.Connection | None = None
+    _lock: Lock = Lock()
+    _sync_lock: Lock = Lock()
+
+    # region Base
+    @classmethod
+    def _connection(cls) -> sqlite3.Connection:
+        if cls._conn is not None:
+            return cls._conn
+
+        save_fold = Config.get_save_dir()
+        if not save_fold.exists():
+            save_fold.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(save_fold / cls._db_name, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS logs ("
+            "id INTEGER PRIMARY KEY, "
+            "type INTEGER, "
+            "creator TEXT, "
+            "data TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS logs_type ON logs(type)")
+        conn.execute("CREATE INDEX IF NOT EXISTS logs_creator ON logs(creator)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+        )
+        conn.commit()
+
+        cls._conn = conn
+        return conn
+
+    @classmethod
+    def close(cls) -> None:
+        with cls._lock:
+            if cls._conn is not None:
+                cls._conn.close()
+                cls._conn = None
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            conn = cls._connection()
+            conn.execute("DELETE FROM logs")
+            conn.execute("DELETE FROM meta")
+            conn.commit()
+
+    @staticmethod
+    def _where(
+        log_type: LogType | None,
+        creator: str | None,
+    ) -> tuple[str, list[Any]]:
+        clauses = []
+        params: list[Any] = []
+
+        if log_type is not None:
+            clauses.append("type = ?")
+            params.append(log_type.value)
+
+        if creator:
+            clauses.append("creator = ?")
+            params.append(creator)
+
+        if not clauses:
+            return "", params
+
+        return " WHERE " + " AND ".join(clauses), params
+
+    # endregion
+
+    # region Sync
+    @classmethod
+    def synced_id(cls) -> int | None:
+        # Only sync moves this, rows pushed live above a gap must not hide it
+        with cls._lock:
+            row = (
+                cls._connection()
+                .execute("SELECT value FROM meta WHERE key = 'synced_id'")
+                .fetchone()
+            )
+
+        return row[0] if row else None
+
+    @classmethod
+    def _set_synced_id(cls, synced_id: int) -> None:
+        with cls._lock:
+            conn = cls._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_id', ?)",
+                (synced_id,),
+            )
+            conn.commit()
+
+    @classmethod
+    def insert(cls, logs: list[dict[str, Any]]) -> None:
+        if not logs:
+            return
+
+        with cls._lock:
+            conn = cls._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO logs (id, type, creator, data) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        log["id"],
+                        log.get("type"),
+                        log.get("creator"),
+                        json.dumps(log, default=str),
+                    )
+                    for log in logs
+                ],
+            )
+            conn.commit()
+
+    @classmethod
+    def sync(cls) -> int:
+        with cls._sync_lock:
+            min_id, max_id = APIManager.logs.min_max_id().values()
+            if min_id is None or max_id is None:
+                cls.clear()
+                return 0
+
+            with cls._lock:
+                conn = cls._connection()
+                conn.execute(
+                    "DELETE FROM logs WHERE id < ? OR id > ?", (min_id, max_id)
+                )
+                conn.commit()
+
+            synced = cls.synced_id()
+            start_id = min_id if synced is None else max(min_id, synced + 1)
+
+            fetched = 0
+            for chunk_start in range(start_id, max_id + 1, cls._sync_chunk):
+                chunk_end = min(chunk_start + cls._sync_chunk - 1, max_id)
+                logs = APIManager.logs.by_range(chunk_start, chunk_end)
+                cls.insert(logs)
+                cls._set_synced_id(chunk_end)
+                fetched += len(logs)
+
+            if start_id > max_id:
+                cls._set_synced_id(max_id)
+
+            if fetched:
+                logger.debug(f"Synced {fetched} new logs up to id {max_id}")
+
+            return fetched
+
+    # endregion
+
+    # region Query
+    @classmethod
+    def max_id(cls) -> int | None:
+        with cls._lock:
+            row = cls._connection().execute("SELECT MAX(id) FROM logs").fetchone()
+
+        return row[0]
+
+    @classmethod
+    def count(
+        cls,
+        log_type: LogType | None = None,
+        creator: str | None = None,
+    ) -> int:
+        where, params = cls._where(log_type, creator)
+        with cls._lock:
+            row = (
+                cls._connection()
+                .execute("SELECT COUNT(*) FROM logs" + where, params)
+                .fetchone()
+            )
+
+        return row[0]
+
+    @classmethod
+    def page(
+        cls,
+        offset: int,
+        limit: int,
+        log_type: LogType | None = None,
+        creator: str | None = None,
+    ) -> list[dict[str, Any]]:
+        where, params = cls._where(log_type, creator)
+        with cls._lock:
+            rows = (
+                cls._connection()
+                .execute(
+                    "SELECT data FROM logs" + where + " ORDER BY id LIMIT ? OFFSET ?",
+                    [*params, limit, offset],
+                )
+                .fetchall()
+            )
+
+        return [json.loads(row[0]) for row in rows]
+
+    @classmethod
+    def by_range(cls, start_id: int, end_id: int) -> list[dict[str, Any]]:
+        with cls._lock:
+            rows = (
+                cls._connection()
+                .execute(
+                    "SELECT data FROM logs WHERE id BETWEEN ? AND ? ORDER BY id",
+                    (start_id, end_id),
+                )
+                .fetchall()
+            )
+
+        return [json.loads(row[0]) for row in rows]
+
+    # endregion
@@ -0,0 +1,74 @@
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(ConnectionError):
+    pass
+
+
+@dataclass
+class RetryPolicy:
+    attempts: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 4.0
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+
+    def should_retry(self, attempt: int, status: int | None = None) -> bool:
+        if attempt + 1 >= self.attempts:
+            return False
+
+        # No status means the request never got a response (timeout, reset, ...)
+        return status is None or status in self.retry_statuses
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+@dataclass
+class CircuitBreaker:
+    host: str
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self.opened_at is None:
+                return
+
+            if time.monotonic() - self.opened_at < self.reset_timeout or self.probing:
+                raise CircuitOpenError(f"{self.host} is unavailable, try again later")
+
+            # Half-open: let a single probe through
+            self.probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info(f"Circuit for {self.host} closed")
+
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self.probing = False
+
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(
+                        f"Circuit for {self.host} opened after {self.failures} failures"
+                    )
+
+                self.opened_at = time.monotonic()
@@ -3,6 +3,7 @@ import math
 import dearpygui.dearpygui as dpg
 
 from .config import Config
+from .frame_task_manager import FrameTaskManager
 from .timer_manager import TimerManager
 
 
@@ -26,7 +27,11 @@ class ThemesManager:
 
         dpg.bind_theme(main)
 
-        TimerManager.add_timer("theme_attention", cls._attention_theme_ch, 0.02)
+        TimerManager.add_timer(
+            "theme_attention",
+            lambda: FrameTaskManager.post(cls._attention_theme_ch, "theme_attention"),
+            0.02,
+        )
 
     @classmethod
     def _lerp_color(
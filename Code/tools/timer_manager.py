@@ -1,8 +1,12 @@
+import heapq
+import itertools
 import logging
 import time
+from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from threading import Event, Lock, Thread
+from threading import Condition, Event, Lock, Thread
 
 logger = logging.getLogger(__name__)
 
@@ -14,21 +18,36 @@ class TimerTask:
     repeat_interval: float
     next_run: float
     repeat_count: int | None = None
+    cancelled: bool = False
+    running: bool = False
+    skipped_ticks: int = 0
 
 
 class TimerManager:
     _is_initialized: bool = False
-    _tasks: list[TimerTask] = []
+    _heap: list[tuple[float, int, TimerTask]] = []
+    _tasks_by_tag: dict[str, list[TimerTask]] = defaultdict(list)
+    _seq = itertools.count()
+    # Zero or negative intervals would reschedule a task into the tick running it
+    _min_interval: float = 0.001
 
     _thread: Thread | None = None
+    _executor: ThreadPoolExecutor | None = None
     _stop_event: Event = Event()
     _lock: Lock = Lock()
+    _cond: Condition = Condition(_lock)
 
     @classmethod
-    def initialize(cls) -> None:
+    def initialize(cls, workers: int = 0) -> None:
         if cls._is_initialized:
             return
 
+        if workers > 0:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="TimerManagerWorker",
+            )
+
         cls._stop_event.clear()
         cls._thread = Thread(target=cls._timer_worker, name="TimerManager", daemon=True)
         cls._thread.start()
@@ -37,12 +56,22 @@ class TimerManager:
     @classmethod
     def stop(cls) -> None:
         cls._stop_event.set()
+        with cls._cond:
+            cls._cond.notify_all()
 
         if cls._thread:
             cls._thread.join()
 
+        if cls._executor:
+            cls._executor.shutdown(wait=True, cancel_futures=True)
+            cls._executor = None
+
         cls._is_initialized = False
 
+    @classmethod
+    def _push(cls, task: TimerTask) -> None:
+        heapq.heappush(cls._heap, (task.next_run, next(cls._seq), task))
+
     @classmethod
     def add_timer(
         cls,
@@ -51,6 +80,7 @@ class TimerManager:
         interval: float,
         repeat_count: int | None = None,
     ):
+        interval = max(interval, cls._min_interval)
         obj = TimerTask(
             tag=tag,
             func=func,
@@ -59,35 +89,114 @@ class TimerManager:
             repeat_count=repeat_count,
         )
 
-        with cls._lock:
-            cls._tasks.append(obj)
+        with cls._cond:
+            cls._tasks_by_tag[tag].append(obj)
+            cls._push(obj)
+            cls._cond.notify()
 
     @classmethod
     def remove_timer(cls, tag: str):
-        with cls._lock:
-            cls._tasks = [t for t in cls._tasks if t.tag != tag]
+        with cls._cond:
+            for task in cls._tasks_by_tag.pop(tag, []):
+                task.cancelled = True
+
+            cls._cond.notify()
+
+    @classmethod
+    def _discard(cls, task: TimerTask) -> None:
+        tasks = cls._tasks_by_tag.get(task.tag)
+        if tasks is None:
+            return
+
+        if task in tasks:
+            tasks.remove(task)
+
+        if not tasks:
+            del cls._tasks_by_tag[task.tag]
+
+    @staticmethod
+    def _next_deadline(task: TimerTask, now: float) -> float:
+        next_run = task.next_run + task.repeat_interval
+        if next_run > now:
+            return next_run
+
+        missed = int((now - task.next_run) // task.repeat_interval)
+        task.skipped_ticks += missed
+        logger.debug(f"Timer {task.tag} fell behind, skipping {missed} tick(s)")
+
+        return task.next_run + (missed + 1) * task.repeat_interval
 
     @classmethod
     def tick(cls):
+        due: list[TimerTask] = []
+        rescheduled: list[TimerTask] = []
         now = time.monotonic()
+
         with cls._lock:
-            for task in cls._tasks[:]:
-                if now >= task.next_run:
-                    try:
-                        task.func()
-                    except Exception as e:
-                        logger.error(f"Error in timer {task.tag}: {e}")
+            while cls._heap and cls._heap[0][0] <= now:
+                _, _, task = heapq.heappop(cls._heap)
+                if task.cancelled:
+                    continue
+
+                if task.running:
+                    task.skipped_ticks += 1
+                    logger.debug(f"Timer {task.tag} is still running, skipping tick")
+
+                else:
+                    task.running = True
+                    due.append(task)
 
                     if task.repeat_count is not None:
                         task.repeat_count -= 1
                         if task.repeat_count <= 0:
-                            cls._tasks.remove(task)
+                            cls._discard(task)
                             continue
 
-                    task.next_run = now + task.repeat_interval
+                task.next_run = cls._next_deadline(task, now)
+                rescheduled.append(task)
+
+            # Pushed after the loop so one tick never pops the same task twice
+            for task in rescheduled:
+                cls._push(task)
+
+        for task in due:
+            if cls._executor is not None:
+                cls._executor.submit(cls._run_task, task)
+            else:
+                cls._run_task(task)
+
+    @classmethod
+    def _run_task(cls, task: TimerTask) -> None:
+        try:
+            task.func()
+        except Exception as e:
+            logger.error(f"Error in timer {task.tag}: {e}")
+        finally:
+            with cls._lock:
+                task.running = False
+
+    @classmethod
+    def _wait_for_deadline(cls) -> None:
+        with cls._cond:
+            while not cls._stop_event.is_set():
+                while cls._heap and cls._heap[0][2].cancelled:
+                    heapq.heappop(cls._heap)
+
+                if not cls._heap:
+                    cls._cond.wait()
+                    continue
+
+                delay = cls._heap[0][0] - time.monotonic()
+                if delay <= 0:
+                    return
+
+                cls._cond.wait(delay)
 
     @classmethod
     def _timer_worker(cls) -> None:
         while not cls._stop_event.is_set():
+            cls._wait_for_deadline()
+            if cls._stop_event.is_set():
+                return
+
             cls.tick()
-            time.sleep(0.01)
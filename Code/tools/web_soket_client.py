@@ -1,12 +1,22 @@
 import json
 import logging
+import random
 import threading
 import time
-from collections import defaultdict
-from typing import Any, Callable, Final
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Final, Protocol
 
 import websocket
 
+from .config import Config
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +24,88 @@ WEBSOCKET_PING: Final[bytes] = b"\x01"
 WEBSOCKET_PONG: Final[bytes] = b"\x02"
 
 
+class Codec(Protocol):
+    name: str
+
+    def available(self) -> bool: ...
+
+    def decode(self, message: str | bytes) -> dict: ...
+
+    def encode(self, data: dict) -> str | bytes: ...
+
+
+class JsonCodec:
+    name: str = "json"
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    @classmethod
+    def decode(cls, message: str | bytes) -> dict:
+        return json.loads(message)
+
+    @classmethod
+    def encode(cls, data: dict) -> str:
+        return json.dumps(data)
+
+
+class MsgPackCodec:
+    name: str = "msgpack"
+
+    @classmethod
+    def available(cls) -> bool:
+        return msgpack is not None
+
+    @classmethod
+    def decode(cls, message: str | bytes) -> dict:
+        return msgpack.unpackb(message, raw=False)  # type: ignore
+
+    @classmethod
+    def encode(cls, data: dict) -> bytes:
+        return msgpack.packb(data, use_bin_type=True)  # type: ignore
+
+
+@dataclass
+class LatencyStats:
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=256))
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> dict[str, float]:
+        ordered = sorted(self.samples)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+            "max": self.max,
+        }
+
+
+class EventPolicy(Enum):
+    # Keep every event, dropping the oldest queued one on overflow
+    QUEUE = "queue"
+    # Keep every event, dropping the incoming one on overflow
+    DROP_NEW = "drop_new"
+    # Keep only the most recent pending event of this name
+    LATEST = "latest"
+
+
 class WebSocketClient:
     _ws: websocket.WebSocketApp | None = None
     _url: str = ""
@@ -22,8 +114,45 @@ class WebSocketClient:
 
     _listener_thread: threading.Thread | None = None
     _running: bool = False
+    _stop_event: threading.Event = threading.Event()
+
+    _reconnect_base: float = 1.0
+    _reconnect_max: float = 30.0
+    _reconnect_attempt: int = 0
+    _was_ready: bool = False
+
+    _ready: threading.Event = threading.Event()
+    _ready_timeout: float = 5.0
+
+    # Ordered by preference, offered to the server as subprotocols
+    _codecs: list[Codec] = [MsgPackCodec, JsonCodec]
+    _codec: Codec = JsonCodec
 
     _handlers: dict[str, list[Callable[[Any], None]]] = defaultdict(list)
+    _resubscribers: dict[str, Callable[[], Any]] = {}
+
+    _max_queue: int = 1000
+    _dispatch_queue: deque[tuple[str, dict | None]] = deque()
+    _latest: dict[str, dict] = {}
+    _dropped: int = 0
+    _dispatch_cond: threading.Condition = threading.Condition()
+    _dispatch_thread: threading.Thread | None = None
+    _policies: dict[str, EventPolicy] = {
+        "server_control_status": EventPolicy.LATEST,
+    }
+
+    # Metrics, all latencies are in milliseconds
+    _ping_interval: float = 20.0
+    _ping_timeout: float = 10.0
+    _rate_window: float = 10.0
+    _metrics_lock: threading.Lock = threading.Lock()
+    _event_times: dict[str, deque[float]] = defaultdict(deque)
+    _event_counts: dict[str, int] = defaultdict(int)
+    _decode_stats: LatencyStats = LatencyStats()
+    _handler_stats: dict[str, LatencyStats] = defaultdict(LatencyStats)
+    _ping_stats: LatencyStats = LatencyStats()
+    _reconnects: int = 0
+    _max_queue_depth: int = 0
 
     @classmethod
     def subscribe(cls, event: str, handler: Callable[[Any], None]) -> None:
@@ -34,60 +163,196 @@ class WebSocketClient:
         cls._handlers[event].remove(handler)
 
     @classmethod
-    def connect(cls, url: str, auth: str) -> None:
-        cls._url = url
-        cls._ws = websocket.WebSocketApp(
-            url,
-            on_message=cls._on_message,
-            on_open=cls._on_open,
-            on_close=cls._on_close,
-            on_error=cls._on_error,
-        )
+    def register_resubscribe(cls, event: str, func: Callable[[], Any]) -> None:
+        cls._resubscribers[event] = func
 
-        cls._running = True
+    @classmethod
+    def set_event_policy(cls, event: str, policy: EventPolicy) -> None:
+        cls._policies[event] = policy
+
+    @classmethod
+    def register_codec(cls, codec: Codec, preferred: bool = False) -> None:
+        if codec in cls._codecs:
+            cls._codecs.remove(codec)
+
+        if preferred:
+            cls._codecs.insert(0, codec)
+        else:
+            cls._codecs.append(codec)
+
+    @classmethod
+    def _subprotocols(cls) -> list[str]:
+        # websocket-client rejects a handshake whose response lacks
+        # Sec-WebSocket-Protocol once any subprotocol is offered, so binary
+        # codecs are opt-in and only for servers that negotiate them
+        if not Config.get("ws_binary_codec", False):
+            return []
+
+        names = [codec.name for codec in cls._codecs if codec.available()]
+        if names == [JsonCodec.name]:
+            return []
+
+        return names
+
+    @classmethod
+    def set_auth(cls, auth: str) -> None:
+        cls._auth = auth
+
+    # region Connection
+    @classmethod
+    def connect(cls, url: str, auth: str) -> threading.Event:
+        if cls._running:
+            cls.disconnect()
+
+        cls._ready.clear()
+        cls._url = url
         cls._auth = auth
-        cls._listener_thread = threading.Thread(target=cls._ws.run_forever, name='WebSocketClient', daemon=True)
+        cls._running = True
+        cls._reconnect_attempt = 0
+        cls._was_ready = False
+
+        cls._stop_event = threading.Event()
+        cls._listener_thread = threading.Thread(
+            target=cls._supervise,
+            args=(cls._stop_event,),
+            name="WebSocketClient",
+            daemon=True,
+        )
         cls._listener_thread.start()
 
-        time.sleep(1)
+        return cls._ready
+
+    @classmethod
+    def _supervise(cls, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            cls._ws = websocket.WebSocketApp(
+                cls._url,
+                on_message=cls._on_message,
+                on_open=cls._on_open,
+                on_close=cls._on_close,
+                on_error=cls._on_error,
+                on_pong=cls._on_pong,
+                subprotocols=cls._subprotocols(),
+            )
+            cls._ws.run_forever(
+                ping_interval=cls._ping_interval, ping_timeout=cls._ping_timeout
+            )
+            cls._ready.clear()
+
+            if stop_event.is_set():
+                return
+
+            with cls._metrics_lock:
+                cls._reconnects += 1
+
+            delay = cls._reconnect_delay()
+            logger.warning(f"WebSocket closed, reconnecting in {delay:.1f}s")
+            stop_event.wait(delay)
+
+    @classmethod
+    def _reconnect_delay(cls) -> float:
+        # Full jitter keeps clients from reconnecting in lockstep after a restart
+        cap = min(cls._reconnect_max, cls._reconnect_base * 2**cls._reconnect_attempt)
+        cls._reconnect_attempt += 1
+        return random.uniform(cls._reconnect_base / 2, cap)
+
+    @classmethod
+    def _replay_subscriptions(cls) -> None:
+        for event, func in list(cls._resubscribers.items()):
+            if not cls._handlers.get(event):
+                continue
+
+            try:
+                func()
+
+            except Exception as e:
+                logger.error(f"Failed to resubscribe to {event}: {e}")
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        return cls._ready.is_set()
+
+    @classmethod
+    def wait_ready(cls, timeout: float | None = None) -> bool:
+        if not cls._running:
+            return False
+
+        if timeout is None:
+            timeout = cls._ready_timeout
+
+        if not cls._ready.wait(timeout):
+            logger.warning(f"WebSocket is not ready after {timeout}s")
+            return False
+
+        return True
 
     @classmethod
     def disconnect(cls) -> None:
         cls._running = False
+        cls._stop_event.set()
+        cls._ready.clear()
         if cls._ws:
             cls._ws.close()
 
         cls._ws = None
         cls._listener_thread = None
 
+    # endregion
+
     @classmethod
     def _on_open(cls, ws):
-        pass
+        subprotocol = ws.sock.getsubprotocol() if ws.sock else None
+        cls._codec = next(
+            (codec for codec in cls._codecs if codec.name == subprotocol),
+            JsonCodec,
+        )
+        logger.debug(f"WebSocket opened with {cls._codec.name} codec")
 
     @classmethod
     def _on_close(cls, ws, close_status_code, close_msg):
-        pass
+        cls._ready.clear()
 
     @classmethod
     def _on_error(cls, ws, error):
         logger.error(f"{error}")
 
     @classmethod
-    def _on_message(cls, ws: websocket.WebSocket, message: str):
+    def _on_message(cls, ws: websocket.WebSocket, message: str | bytes):
         if message == WEBSOCKET_PING:
             ws.send_bytes(WEBSOCKET_PONG)
             return
 
         if message == "auth request":
             ws.send_text(cls._auth)
+            cls._ready.set()
+            cls._reconnect_attempt = 0
+
+            if cls._was_ready:
+                threading.Thread(
+                    target=cls._replay_subscriptions,
+                    name="WebSocketResubscribe",
+                    daemon=True,
+                ).start()
+
+            cls._was_ready = True
             return
 
+        # Text frames are always JSON, binary ones use the negotiated codec
+        codec = JsonCodec if isinstance(message, str) else cls._codec
+
+        start = time.perf_counter()
         try:
-            data = json.loads(message)
-            cls.handle_message(data)
+            data = codec.decode(message)
 
-        except json.JSONDecodeError:
-            pass
+        except ValueError as e:
+            logger.debug(f"Failed to decode {codec.name} message: {e}")
+            return
+
+        with cls._metrics_lock:
+            cls._decode_stats.add((time.perf_counter() - start) * 1000)
+
+        if isinstance(data, dict):
+            cls.handle_message(data)
 
     @classmethod
     def handle_message(cls, data: dict) -> None:
@@ -95,13 +360,134 @@ class WebSocketClient:
         if not event:
             return
 
+        now = time.monotonic()
+        with cls._metrics_lock:
+            cls._event_counts[event] += 1
+            times = cls._event_times[event]
+            times.append(now)
+            while times[0] < now - cls._rate_window:
+                times.popleft()
+
         cls._dispatch_event(event, data)
 
+    # region Dispatch
     @classmethod
     def _dispatch_event(cls, event: str, data: dict) -> None:
-        for handler in cls._handlers.get(event, []):
+        policy = cls._policies.get(event, EventPolicy.QUEUE)
+
+        with cls._dispatch_cond:
+            if policy is EventPolicy.LATEST:
+                pending = event in cls._latest
+                cls._latest[event] = data
+                if pending:
+                    return
+
+                data = None
+
+            if len(cls._dispatch_queue) >= cls._max_queue:
+                cls._dropped += 1
+                if policy is EventPolicy.DROP_NEW:
+                    logger.warning(f"Dispatch queue is full, dropping {event}")
+                    return
+
+                old_event, _ = cls._dispatch_queue.popleft()
+                cls._latest.pop(old_event, None)
+                logger.warning(f"Dispatch queue is full, dropping {old_event}")
+
+            cls._dispatch_queue.append((event, data))
+            cls._max_queue_depth = max(cls._max_queue_depth, len(cls._dispatch_queue))
+            cls._dispatch_cond.notify()
+
+            if cls._dispatch_thread is None:
+                cls._dispatch_thread = threading.Thread(
+                    target=cls._dispatch_worker,
+                    name="WebSocketDispatch",
+                    daemon=True,
+                )
+                cls._dispatch_thread.start()
+
+    @classmethod
+    def _dispatch_worker(cls) -> None:
+        while True:
+            with cls._dispatch_cond:
+                while not cls._dispatch_queue:
+                    cls._dispatch_cond.wait()
+
+                event, data = cls._dispatch_queue.popleft()
+                if data is None:
+                    data = cls._latest.pop(event, None)
+                    if data is None:
+                        continue
+
+            cls._run_handlers(event, data)
+
+    @classmethod
+    def _run_handlers(cls, event: str, data: dict) -> None:
+        start = time.perf_counter()
+        for handler in list(cls._handlers.get(event, [])):
             try:
                 handler(**data)  # type: ignore
 
             except Exception as e:
                 logger.error(f"Error in handler for {event}: {e}")
+
+        with cls._metrics_lock:
+            cls._handler_stats[event].add((time.perf_counter() - start) * 1000)
+
+    # endregion
+
+    # region Metrics
+    @classmethod
+    def _on_pong(cls, ws: websocket.WebSocketApp, data: bytes) -> None:
+        if not ws.last_ping_tm or ws.last_pong_tm < ws.last_ping_tm:
+            return
+
+        with cls._metrics_lock:
+            cls._ping_stats.add((ws.last_pong_tm - ws.last_ping_tm) * 1000)
+
+    @classmethod
+    def metrics_snapshot(cls) -> dict[str, Any]:
+        now = time.monotonic()
+        with cls._dispatch_cond:
+            queue_depth = len(cls._dispatch_queue)
+            max_queue_depth = cls._max_queue_depth
+            dropped = cls._dropped
+
+        with cls._metrics_lock:
+            events = {}
+            since = now - cls._rate_window
+            for event, count in cls._event_counts.items():
+                recent = [t for t in cls._event_times[event] if t >= since]
+                events[event] = {
+                    "count": count,
+                    "rate": len(recent) / cls._rate_window,
+                    "handler": cls._handler_stats[event].snapshot(),
+                }
+
+            return {
+                "connected": cls.is_ready(),
+                "codec": cls._codec.name,
+                "reconnects": cls._reconnects,
+                "queue_depth": queue_depth,
+                "max_queue_depth": max_queue_depth,
+                "dropped": dropped,
+                "decode": cls._decode_stats.snapshot(),
+                "ping": cls._ping_stats.snapshot(),
+                "events": events,
+            }
+
+    @classmethod
+    def reset_metrics(cls) -> None:
+        with cls._dispatch_cond:
+            cls._max_queue_depth = len(cls._dispatch_queue)
+            cls._dropped = 0
+
+        with cls._metrics_lock:
+            cls._event_times.clear()
+            cls._event_counts.clear()
+            cls._handler_stats.clear()
+            cls._decode_stats = LatencyStats()
+            cls._ping_stats = LatencyStats()
+            cls._reconnects = 0
+
+    # endregion
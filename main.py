@@ -1,13 +1,20 @@
-import argparse
-import logging
-import os
-import platform
-import signal
 import sys
 
-from colorama import Fore, Style, init
+# Must run before the heavy imports below so they show up in the report
+if "--profile-startup" in sys.argv:
+    from Code.startup_profiler import StartupProfiler
 
-from Code.app import Core
+    StartupProfiler.enable()
+
+import argparse  # noqa: E402
+import logging  # noqa: E402
+import os  # noqa: E402
+import platform  # noqa: E402
+import signal  # noqa: E402
+
+from colorama import Fore, Style, init  # noqa: E402
+
+from Code.app import Core  # noqa: E402
 
 
 def signal_handler(signum, frame):
@@ -80,6 +87,11 @@ if __name__ == "__main__":
 
         parser = argparse.ArgumentParser()
         parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+        parser.add_argument(
+            "--profile-startup",
+            action="store_true",
+            help="Write a startup timing report to the save directory",
+        )
         args = parser.parse_args()
 
         configure_logging(args.debug)
@@ -0,0 +1,80 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from Code.tools import Config
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    source = tmp_path / "Данные"
+    (source / "fonts").mkdir(parents=True)
+    (source / "fonts" / "font.otf").write_bytes(b"font")
+    (source / "icon.png").write_bytes(b"icon")
+    (source / "logo.png").write_bytes(b"logo")
+    return source
+
+
+def test_resolve_data_dir_keeps_path_outside_windows(data_dir: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+
+    assert Config.resolve_data_dir(data_dir, "Linux", cache) == data_dir
+    assert not cache.exists()
+
+
+def test_resolve_data_dir_copies_non_ascii_path_on_windows(
+    data_dir: Path, tmp_path: Path
+):
+    cache = tmp_path / "cache"
+
+    assert Config.resolve_data_dir(data_dir, "Windows", cache) == cache
+    assert (cache / "fonts" / "font.otf").read_bytes() == b"font"
+
+
+def test_sync_copies_everything_on_first_run(data_dir: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+
+    assert Config.sync_data_cache(data_dir, cache) == 3
+    assert (cache / "icon.png").read_bytes() == b"icon"
+    assert (cache / "logo.png").read_bytes() == b"logo"
+
+
+def test_sync_skips_unchanged_files(data_dir: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+    Config.sync_data_cache(data_dir, cache)
+
+    assert Config.sync_data_cache(data_dir, cache) == 0
+
+
+def test_sync_copies_only_changed_files(data_dir: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+    Config.sync_data_cache(data_dir, cache)
+
+    icon = data_dir / "icon.png"
+    icon.write_bytes(b"ICON")
+    mtime = icon.stat().st_mtime_ns + 1_000_000_000
+    os.utime(icon, ns=(mtime, mtime))
+
+    assert Config.sync_data_cache(data_dir, cache) == 1
+    assert (cache / "icon.png").read_bytes() == b"ICON"
+
+
+def test_sync_deletes_removed_files(data_dir: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+    Config.sync_data_cache(data_dir, cache)
+
+    (data_dir / "logo.png").unlink()
+
+    assert Config.sync_data_cache(data_dir, cache) == 0
+    assert not (cache / "logo.png").exists()
+
+
+def test_sync_recopies_missing_destination(data_dir: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+    Config.sync_data_cache(data_dir, cache)
+
+    (cache / "fonts" / "font.otf").unlink()
+
+    assert Config.sync_data_cache(data_dir, cache) == 1
+    assert (cache / "fonts" / "font.otf").read_bytes() == b"font"